@@ -10,7 +10,8 @@ License: MIT
 """
 
 import os
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any
 from airtable import Airtable
 from dotenv import load_dotenv
 import logging
@@ -25,6 +26,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fields shown when listing the backlog; skips the long enrichment text
+BACKLOG_LIST_FIELDS = ['IdeaTitle', 'ProblemStatement', 'DataSource', 'Subreddit']
+
+# Airtable returns at most 100 records per page
+MAX_PAGE_SIZE = 100
+
 
 class AirtableIdeaManager:
     """Manages startup ideas in Airtable database."""
@@ -99,19 +106,95 @@ class AirtableIdeaManager:
             logger.error(f"Error updating idea status: {e}")
             return False
     
-    def get_ideas_by_status(self, status: str) -> List[Dict[str, Any]]:
+    def iter_ideas(self, formula: Optional[str] = None, fields: Optional[List[str]] = None,
+                   sort: Optional[List[str]] = None, limit: Optional[int] = None,
+                   page_size: int = MAX_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Stream idea records page by page.
+        
+        The next page is fetched in the background while the current one is
+        being consumed, and nothing more is requested once the caller stops
+        iterating or the limit is reached. Errors from any page propagate to
+        the caller, so a partial stream is never mistaken for a complete one.
+        
+        Args:
+            formula: Optional Airtable filter formula
+            fields: Optional list of fields to return (all fields if omitted)
+            sort: Optional sort order, e.g. ['-FeasibilityScore', 'IdeaTitle']
+            limit: Optional maximum number of records to return
+            page_size: Records per request (at most 100)
+            
+        Yields:
+            Idea records
+        """
+        options = {'page_size': min(page_size, limit or page_size, MAX_PAGE_SIZE)}
+        if formula:
+            options['formula'] = formula
+        if fields:
+            options['fields'] = fields
+        if sort:
+            options['sort'] = sort
+        if limit:
+            options['max_records'] = limit
+        
+        pages = self.airtable.get_iter(**options)
+        executor = ThreadPoolExecutor(max_workers=1)
+        remaining = limit
+        try:
+            next_page = executor.submit(next, pages, None)
+            while True:
+                page = next_page.result()
+                if page is None:
+                    break
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+                
+                if remaining != 0:
+                    next_page = executor.submit(next, pages, None)
+                yield from page
+                
+                if remaining == 0:
+                    break
+        finally:
+            # Don't block on a prefetch the caller no longer needs
+            executor.shutdown(wait=False)
+    
+    def iter_ideas_by_status(self, status: str, fields: Optional[List[str]] = None,
+                             sort: Optional[List[str]] = None,
+                             limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream ideas with a specific status page by page.
+        
+        Args:
+            status: Status to filter by
+            fields: Optional list of fields to return (all fields if omitted)
+            sort: Optional sort order, e.g. ['-FeasibilityScore', 'IdeaTitle']
+            limit: Optional maximum number of records to return
+            
+        Yields:
+            Idea records
+        """
+        formula = f"{{Status}}='{status}'"
+        return self.iter_ideas(formula=formula, fields=fields, sort=sort, limit=limit)
+    
+    def get_ideas_by_status(self, status: str, fields: Optional[List[str]] = None,
+                            sort: Optional[List[str]] = None,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Retrieve all ideas with a specific status.
         
         Args:
             status: Status to filter by
+            fields: Optional list of fields to return (all fields if omitted)
+            sort: Optional sort order, e.g. ['-FeasibilityScore', 'IdeaTitle']
+            limit: Optional maximum number of records to return
             
         Returns:
             List of idea records
         """
         try:
-            formula = f"{{Status}}='{status}'"
-            records = self.airtable.get_all(formula=formula)
+            records = list(self.iter_ideas_by_status(status, fields=fields, sort=sort, limit=limit))
             logger.info(f"Retrieved {len(records)} ideas with status: {status}")
             return records
             
@@ -162,19 +245,24 @@ class AirtableIdeaManager:
             logger.error(f"Error enriching idea: {e}")
             return False
     
-    def list_backlog_ideas(self) -> None:
-        """Display all ideas in the backlog for easy review."""
+    def list_backlog_ideas(self, limit: Optional[int] = None) -> None:
+        """
+        Display ideas in the backlog for easy review.
+        
+        Rows are printed as each page arrives and only the listed fields are fetched.
+        
+        Args:
+            limit: Optional maximum number of ideas to show
+        """
         try:
-            backlog_ideas = self.get_ideas_by_status('Backlog')
+            count = 0
             
-            if not backlog_ideas:
-                print("📝 No ideas in backlog")
-                return
-            
-            print(f"\n📋 Backlog Ideas ({len(backlog_ideas)} total):")
-            print("-" * 60)
-            
-            for idea in backlog_ideas:
+            for idea in self.iter_ideas_by_status('Backlog', fields=BACKLOG_LIST_FIELDS, limit=limit):
+                if count == 0:
+                    print("\n📋 Backlog Ideas:")
+                    print("-" * 60)
+                count += 1
+                
                 fields = idea['fields']
                 print(f"ID: {idea['id']}")
                 print(f"Title: {fields.get('IdeaTitle', 'N/A')}")
@@ -183,22 +271,33 @@ class AirtableIdeaManager:
                 if fields.get('Subreddit'):
                     print(f"Subreddit: r/{fields.get('Subreddit')}")
                 print("-" * 60)
+            
+            if count == 0:
+                print("📝 No ideas in backlog")
+            else:
+                print(f"{count} backlog ideas shown")
                 
         except Exception as e:
             logger.error(f"Error listing backlog ideas: {e}")
             print(f"❌ Error: {e}")
     
-    def get_idea_by_id(self, idea_id: str) -> Optional[Dict[str, Any]]:
+    def get_idea_by_id(self, idea_id: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific idea by ID.
         
         Args:
             idea_id: The Airtable record ID
+            fields: Optional list of fields to return (all fields if omitted)
             
         Returns:
             Idea record if found, None otherwise
         """
         try:
+            if fields:
+                # Single-record reads can't project fields, so filter the list endpoint instead
+                formula = f"RECORD_ID()='{idea_id}'"
+                return next(self.iter_ideas(formula=formula, fields=fields, limit=1), None)
+            
             record = self.airtable.get(idea_id)
             return record
             
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Engagement Tracker for Reddit Ideas Scrapper
+
+Records the score and comment count of a post every time it is seen, in a
+compact delta-encoded time series, and derives velocity and acceleration
+metrics that surface pain points gaining traction.
+
+Author: Anthony Stepvoy
+License: MIT
+"""
+
+import os
+import json
+import logging
+from array import array
+from datetime import datetime
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGAGEMENT_FILE = os.path.join('data', 'engagement.json')
+SECONDS_PER_HOUR = 60 * 60
+
+
+class EngagementTracker:
+    """
+    Per-post engagement time series.
+
+    Each post stores three parallel arrays of deltas: seconds since the
+    previous observation (the first relative to post creation), score change
+    and comment count change. Deltas stay small, so the arrays and the saved
+    JSON are compact, and a post's history is capped at ``max_points`` by
+    merging the most closely spaced observations.
+    """
+
+    def __init__(self, max_points: int = 48, early_window_hours: float = 6.0):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            max_points: Maximum observations kept per post
+            early_window_hours: Length of the early window used for launch velocity
+        """
+        self.max_points = max_points
+        self.early_window_hours = early_window_hours
+        self.series: Dict[str, Dict] = {}
+
+    def record(self, post: Dict, observed_at: Optional[float] = None) -> bool:
+        """
+        Append an engagement observation for a post.
+
+        Args:
+            post: Post dictionary with id, created_utc, score and num_comments
+            observed_at: Optional Unix timestamp of the observation (defaults to now)
+
+        Returns:
+            True if the observation was stored, False if it was not newer than the last one
+        """
+        observed_at = int(observed_at if observed_at is not None else datetime.now().timestamp())
+        series = self.series.get(post['id'])
+
+        if series is None:
+            series = self.series[post['id']] = {
+                'created_utc': int(post['created_utc']),
+                'subreddit': post.get('subreddit'),
+                'title': post.get('title', ''),
+                'times': array('l'),
+                'scores': array('l'),
+                'comments': array('l'),
+                'last': (int(post['created_utc']), 0, 0)
+            }
+
+        last_time, last_score, last_comments = series['last']
+        if observed_at <= last_time and series['times']:
+            return False
+
+        series['times'].append(max(0, observed_at - last_time))
+        series['scores'].append(post['score'] - last_score)
+        series['comments'].append(post['num_comments'] - last_comments)
+        series['last'] = (max(observed_at, last_time), post['score'], post['num_comments'])
+
+        if len(series['times']) > self.max_points:
+            self._downsample(series)
+        return True
+
+    def record_many(self, posts: Iterable[Dict], observed_at: Optional[float] = None) -> int:
+        """
+        Append observations for many posts.
+
+        Args:
+            posts: Post dictionaries, each optionally carrying its own observed_at timestamp
+            observed_at: Timestamp used for posts without one (defaults to now)
+
+        Returns:
+            Number of observations stored
+        """
+        recorded = sum(1 for post in posts if self.record(post, post.get('observed_at', observed_at)))
+        logger.info(f"Recorded engagement for {recorded} posts")
+        return recorded
+
+    @staticmethod
+    def _downsample(series: Dict) -> None:
+        """Drop the observation closest in time to its predecessor, keeping the first and last."""
+        times = series['times']
+        # Merging point i into i+1 keeps every later absolute value unchanged
+        drop = min(range(1, len(times) - 1), key=lambda i: times[i])
+        for key in ('times', 'scores', 'comments'):
+            values = series[key]
+            values[drop + 1] += values[drop]
+            del values[drop]
+
+    def points(self, post_id: str) -> List[Tuple[float, int, int]]:
+        """
+        Decode a post's series into absolute observations.
+
+        Returns:
+            List of (timestamp, score, num_comments) tuples, oldest first
+        """
+        series = self.series[post_id]
+        times = accumulate(series['times'], initial=series['created_utc'])
+        scores = accumulate(series['scores'], initial=0)
+        comments = accumulate(series['comments'], initial=0)
+        return list(zip(times, scores, comments))[1:]
+
+    def _early_comments_per_hour(self, post_id: str, now: float) -> Optional[float]:
+        """
+        Measure the comment rate over a post's early window from actual observations.
+
+        The comment count at the end of the window is interpolated between the
+        last sighting inside the window and the first one after it. A post
+        still inside its window is measured up to its latest sighting.
+
+        Returns:
+            Comments per hour, or None if the post was not seen inside its early
+            window or has no sighting after it despite being older than it
+        """
+        created = self.series[post_id]['created_utc']
+        window_end = created + self.early_window_hours * SECONDS_PER_HOUR
+        inside = after = None
+        for point in self.points(post_id):
+            if point[0] <= window_end:
+                inside = point
+            else:
+                after = point
+                break
+
+        if inside is None:
+            return None
+        if after is None:
+            if now < window_end and inside[0] > created:
+                return inside[2] / ((inside[0] - created) / SECONDS_PER_HOUR)
+            return None
+
+        fraction = (window_end - inside[0]) / (after[0] - inside[0])
+        comments = inside[2] + fraction * (after[2] - inside[2])
+        return comments / self.early_window_hours
+
+    def metrics(self, post_id: str, now: Optional[float] = None) -> Dict:
+        """
+        Compute velocity and acceleration metrics for a post.
+
+        Velocities use the latest interval between observations, falling back
+        to the lifetime average when a post has only been seen once.
+
+        Args:
+            post_id: Reddit post ID
+            now: Optional Unix timestamp used to compute the post's age
+
+        Returns:
+            Dictionary of engagement metrics
+        """
+        series = self.series[post_id]
+        points = self.points(post_id)
+        created = series['created_utc']
+        now = now if now is not None else datetime.now().timestamp()
+        age_hours = max(now - created, 1) / SECONDS_PER_HOUR
+
+        # Treat creation as an observation with no engagement so one sighting still has a rate
+        history = [(created, 0, 0)] + points
+        intervals = []
+        for (t0, s0, c0), (t1, s1, c1) in zip(history, history[1:]):
+            hours = (t1 - t0) / SECONDS_PER_HOUR
+            if hours > 0:
+                intervals.append(((t0 + t1) / 2, (s1 - s0) / hours, (c1 - c0) / hours))
+
+        score_velocity = intervals[-1][1] if intervals else 0.0
+        comment_velocity = intervals[-1][2] if intervals else 0.0
+
+        comment_acceleration = None
+        if len(intervals) >= 2:
+            (m0, _, v0), (m1, _, v1) = intervals[-2], intervals[-1]
+            comment_acceleration = (v1 - v0) / ((m1 - m0) / SECONDS_PER_HOUR)
+
+        early_velocity = self._early_comments_per_hour(post_id, now)
+
+        return {
+            'id': post_id,
+            'title': series['title'],
+            'subreddit': series['subreddit'],
+            'observations': len(points),
+            'age_hours': round(age_hours, 2),
+            'score': points[-1][1],
+            'num_comments': points[-1][2],
+            'score_per_hour': round(score_velocity, 2),
+            'comments_per_hour': round(comment_velocity, 2),
+            'comment_acceleration': round(comment_acceleration, 3) if comment_acceleration is not None else None,
+            'early_comments_per_hour': round(early_velocity, 2) if early_velocity is not None else None
+        }
+
+    def top_by_velocity(self, metric: str = 'comments_per_hour', top: int = 10,
+                        max_age_hours: Optional[float] = None, now: Optional[float] = None) -> List[Dict]:
+        """
+        Rank tracked posts by a velocity metric.
+
+        Args:
+            metric: Metric name from metrics(), e.g. 'comments_per_hour' or 'early_comments_per_hour'
+            top: Maximum number of posts to return
+            max_age_hours: Optional age limit for included posts
+            now: Optional Unix timestamp used to compute post ages
+
+        Returns:
+            List of metric dictionaries, fastest first; posts without a value
+            for the metric (e.g. never seen in their early window) are left out
+        """
+        now = now if now is not None else datetime.now().timestamp()
+        results = []
+        for post_id, series in self.series.items():
+            if max_age_hours is not None and now - series['created_utc'] > max_age_hours * SECONDS_PER_HOUR:
+                continue
+            metrics = self.metrics(post_id, now)
+            if metrics[metric] is not None:
+                results.append(metrics)
+
+        results.sort(key=lambda m: m[metric], reverse=True)
+        return results[:top]
+
+    def ids_to_refresh(self, max_age_hours: float = 72, now: Optional[float] = None) -> List[str]:
+        """
+        List tracked posts still young enough to be worth re-polling, newest first.
+
+        Args:
+            max_age_hours: Posts older than this are no longer refreshed
+            now: Optional Unix timestamp used to compute post ages
+        """
+        now = now if now is not None else datetime.now().timestamp()
+        cutoff = now - max_age_hours * SECONDS_PER_HOUR
+        fresh = [post_id for post_id, series in self.series.items() if series['created_utc'] >= cutoff]
+        return sorted(fresh, key=lambda post_id: self.series[post_id]['created_utc'], reverse=True)
+
+    def prune(self, max_age_days: int = 30, now: Optional[float] = None) -> int:
+        """
+        Forget posts older than the retention period.
+
+        Returns:
+            Number of posts removed
+        """
+        now = now if now is not None else datetime.now().timestamp()
+        cutoff = now - max_age_days * 24 * SECONDS_PER_HOUR
+        stale = [post_id for post_id, series in self.series.items() if series['created_utc'] < cutoff]
+        for post_id in stale:
+            del self.series[post_id]
+        return len(stale)
+
+    def to_dict(self) -> Dict:
+        """Serialize the tracker state to a JSON-compatible dictionary."""
+        return {
+            'max_points': self.max_points,
+            'early_window_hours': self.early_window_hours,
+            'series': {
+                post_id: {
+                    'created_utc': series['created_utc'],
+                    'subreddit': series['subreddit'],
+                    'title': series['title'],
+                    'times': series['times'].tolist(),
+                    'scores': series['scores'].tolist(),
+                    'comments': series['comments'].tolist()
+                }
+                for post_id, series in self.series.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'EngagementTracker':
+        """Rebuild a tracker from a dictionary produced by to_dict."""
+        tracker = cls(max_points=data['max_points'], early_window_hours=data['early_window_hours'])
+        for post_id, stored in data['series'].items():
+            series = {
+                'created_utc': stored['created_utc'],
+                'subreddit': stored['subreddit'],
+                'title': stored['title'],
+                'times': array('l', stored['times']),
+                'scores': array('l', stored['scores']),
+                'comments': array('l', stored['comments'])
+            }
+            series['last'] = (stored['created_utc'] + sum(series['times']),
+                              sum(series['scores']), sum(series['comments']))
+            tracker.series[post_id] = series
+        return tracker
+
+    def save(self, path: str = DEFAULT_ENGAGEMENT_FILE) -> None:
+        """
+        Save the tracker state to disk.
+
+        Args:
+            path: Location of the engagement file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        logger.info(f"Engagement history saved to {path}")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_ENGAGEMENT_FILE) -> 'EngagementTracker':
+        """
+        Load the tracker state from disk, starting empty if there is none.
+
+        Args:
+            path: Location of the engagement file
+
+        Returns:
+            EngagementTracker instance
+        """
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load engagement history from {path}: {e}")
+            return cls()
+
+
+def print_velocity(ranked: List[Dict]) -> None:
+    """Print a table of the fastest-growing posts."""
+    if not ranked:
+        print("🐢 No tracked posts yet")
+        return
+
+    for i, post in enumerate(ranked, 1):
+        acceleration = post['comment_acceleration']
+        trend = "" if acceleration is None else (" ↑" if acceleration > 0 else " ↓")
+        early = post['early_comments_per_hour']
+        print(f"{i}. {post['title'][:80]}")
+        print(f"   Subreddit: r/{post['subreddit']} | Age: {post['age_hours']}h")
+        print(f"   Comments/h: {post['comments_per_hour']}{trend} | "
+              f"Early comments/h: {early if early is not None else 'n/a'} | "
+              f"Score/h: {post['score_per_hour']}")
+        print("-" * 50)
@@ -0,0 +1,701 @@
+#!/usr/bin/env python3
+"""
+Idea Clustering for Reddit Ideas Scrapper
+
+Groups idea candidates that describe the same underlying problem into themes
+using hashed sparse text vectors and incremental mini-batch clustering, so
+new scans update existing themes instead of reclustering from scratch.
+
+Author: Anthony Stepvoy
+License: MIT
+"""
+
+import os
+import json
+import math
+import zlib
+import base64
+import argparse
+import logging
+from array import array
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from trend_engine import SECONDS_PER_DAY, extract_phrases
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLUSTERS_FILE = os.path.join('data', 'idea_clusters.json')
+
+
+class HashingVectorizer:
+    """Turns post text into sparse signed term-frequency vectors using the hashing trick."""
+
+    def __init__(self, n_features: int = 2 ** 18, title_weight: float = 2.0):
+        """
+        Configure the vectorizer.
+
+        Args:
+            n_features: Size of the hashed feature space
+            title_weight: Multiplier applied to phrases found in the title
+        """
+        self.n_features = n_features
+        self.title_weight = title_weight
+
+    def phrases(self, title: str, selftext: str = '') -> Dict[str, float]:
+        """
+        Extract weighted phrases from a post.
+
+        Args:
+            title: Post title
+            selftext: Post body
+
+        Returns:
+            Phrase weights, with title phrases weighted up
+        """
+        phrases: Dict[str, float] = defaultdict(float)
+        for phrase in extract_phrases(title or ''):
+            phrases[phrase] += self.title_weight
+        for phrase in extract_phrases(selftext or ''):
+            phrases[phrase] += 1.0
+        return phrases
+
+    def transform(self, phrases: Dict[str, float]) -> Dict[int, float]:
+        """
+        Hash weighted phrases into a sparse vector.
+
+        Args:
+            phrases: Phrase weights from phrases()
+
+        Returns:
+            Unnormalised sparse vector keyed by feature index
+        """
+        vector: Dict[int, float] = defaultdict(float)
+        for phrase, weight in phrases.items():
+            h = zlib.crc32(phrase.encode('utf-8'))
+            # The top hash bit picks a sign so collisions tend to cancel out
+            sign = -1.0 if h & 0x80000000 else 1.0
+            vector[h % self.n_features] += sign * (1.0 + math.log(weight))
+        return vector
+
+
+def _normalize(vector: Dict[int, float]) -> Dict[int, float]:
+    """Scale a sparse vector to unit length."""
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    if not norm:
+        return {}
+    return {idx: w / norm for idx, w in vector.items()}
+
+
+def _dot(vector: Dict[int, float], other: Dict[int, float]) -> float:
+    """Dot product of two sparse vectors."""
+    if len(vector) > len(other):
+        vector, other = other, vector
+    return sum(w * other.get(idx, 0.0) for idx, w in vector.items())
+
+
+class IdeaClusterer:
+    """
+    Incremental spherical mini-batch clustering of idea candidates.
+
+    Document frequencies are tracked in a fixed array over the hashed feature
+    space. Features seen in too few posts (``min_df``, or ``min_df_ratio`` of
+    all posts) are ignored, so incidental words in long selftext neither
+    dilute a post's similarity to its theme nor seed clusters of their own.
+    The remaining features are IDF-weighted so filler shared by every theme
+    does not pull themes together.
+
+    Each batch is assigned to the nearest existing centroid by cosine
+    similarity. Nearest centroids are found through an inverted index over
+    centroid features, so only clusters that share a term are scored. Posts
+    below the similarity threshold seed new clusters. Centroids then move
+    towards the running mean of their members and are pruned to their
+    strongest features.
+
+    Every ``maintenance_interval`` batches, and whenever the cluster cap is
+    reached, clusters whose centroids have converged on the same theme are
+    merged. A cluster that has not grown for ``stale_batches`` batches is
+    folded into its nearest cluster if it would pass the join threshold as a
+    post, or retired if it is small, which keeps room for new themes to form.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.1, max_clusters: int = 2000,
+                 max_centroid_terms: int = 64, batch_size: int = 256,
+                 num_representatives: int = 3, history_days: int = 90,
+                 min_df: int = 2, min_df_ratio: float = 0.002, merge_threshold: float = 0.2, retire_size: int = 2,
+                 stale_batches: int = 20, maintenance_interval: int = 10,
+                 vectorizer: Optional[HashingVectorizer] = None):
+        """
+        Initialize an empty clusterer.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity to join an existing cluster
+            max_clusters: Cap on the number of clusters; beyond it posts join their nearest cluster
+            max_centroid_terms: Features kept per centroid after each update
+            batch_size: Posts assigned before centroids are updated
+            num_representatives: Representative posts kept per cluster
+            history_days: Days of per-cluster daily counts kept for growth metrics
+            min_df: Minimum number of posts a feature must appear in to count towards similarity
+            min_df_ratio: Minimum share of all posts a feature must appear in, applied on top of min_df
+            merge_threshold: Centroid cosine similarity above which two clusters are merged
+            retire_size: Clusters this small are retired once stale
+            stale_batches: Batches without new members after which a small cluster is stale
+            maintenance_interval: Batches between merge and retirement passes
+            vectorizer: Optional vectorizer; defaults to HashingVectorizer()
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_clusters = max_clusters
+        self.max_centroid_terms = max_centroid_terms
+        self.batch_size = batch_size
+        self.num_representatives = num_representatives
+        self.history_days = history_days
+        self.min_df = min_df
+        self.min_df_ratio = min_df_ratio
+        self.merge_threshold = merge_threshold
+        self.retire_size = retire_size
+        self.stale_batches = stale_batches
+        self.maintenance_interval = maintenance_interval
+        self.vectorizer = vectorizer or HashingVectorizer()
+
+        self.doc_freq = array('I', [0]) * self.vectorizer.n_features
+        self.num_docs = 0
+        self.batches_fitted = 0
+
+        self.clusters: Dict[int, Dict] = {}
+        self.assignments: Dict[str, int] = {}
+        # Clusters folded into another cluster, so old assignments still resolve
+        self.merged_into: Dict[int, int] = {}
+        self.postings: Dict[int, Dict[int, float]] = defaultdict(dict)
+        self.next_cluster_id = 0
+
+    def _weight(self, features: Dict[int, float]) -> Dict[int, float]:
+        """
+        Drop rare features and apply IDF weighting to a post vector.
+
+        Falls back to the raw vector if none of its features are common yet,
+        so the post can still seed a cluster.
+        """
+        min_df = max(self.min_df, self.min_df_ratio * self.num_docs)
+        weighted = {}
+        for idx, weight in features.items():
+            df = self.doc_freq[idx]
+            if df >= min_df:
+                weighted[idx] = weight * math.log((self.num_docs + 1) / df)
+        return _normalize(weighted) or _normalize(features)
+
+    def _nearest(self, vector: Dict[int, float], exclude: Optional[int] = None) -> Tuple[Optional[int], float]:
+        """Return the most similar cluster and its cosine similarity."""
+        scores: Dict[int, float] = defaultdict(float)
+        for idx, weight in vector.items():
+            for cluster_id, centroid_weight in self.postings.get(idx, {}).items():
+                scores[cluster_id] += weight * centroid_weight
+        scores.pop(exclude, None)
+
+        if not scores:
+            return None, 0.0
+        best = max(scores, key=scores.get)
+        return best, scores[best]
+
+    def _unindex(self, cluster_id: int) -> None:
+        """Remove a cluster's centroid from the inverted index."""
+        for idx in self.clusters[cluster_id]['centroid']:
+            postings = self.postings.get(idx)
+            if postings is not None:
+                postings.pop(cluster_id, None)
+                if not postings:
+                    del self.postings[idx]
+
+    def _set_centroid(self, cluster_id: int, centroid: Dict[int, float]) -> None:
+        """Prune and normalise a centroid, then refresh its inverted index entries."""
+        self._unindex(cluster_id)
+
+        if len(centroid) > self.max_centroid_terms:
+            strongest = sorted(centroid, key=lambda i: abs(centroid[i]), reverse=True)
+            centroid = {idx: centroid[idx] for idx in strongest[:self.max_centroid_terms]}
+        centroid = _normalize(centroid)
+
+        self.clusters[cluster_id]['centroid'] = centroid
+        for idx, weight in centroid.items():
+            self.postings[idx][cluster_id] = weight
+
+    def _new_cluster(self, vector: Dict[int, float]) -> int:
+        """Create a cluster seeded with a vector."""
+        cluster_id = self.next_cluster_id
+        self.next_cluster_id += 1
+        self.clusters[cluster_id] = {
+            'centroid': {},
+            'size': 0,
+            'terms': {},
+            'representatives': [],
+            'daily_counts': {},
+            'members': [],
+            'last_batch': self.batches_fitted
+        }
+        self._set_centroid(cluster_id, vector)
+        return cluster_id
+
+    def _rank_representatives(self, cluster: Dict, candidates: List[Dict]) -> None:
+        """Keep the candidates closest to the cluster's current centroid."""
+        centroid = cluster['centroid']
+        for rep in candidates:
+            vector = rep['vector']
+            if isinstance(vector, list):
+                vector = dict(vector)
+            rep['similarity'] = round(_dot(vector, centroid), 4)
+
+        kept = sorted(candidates, key=lambda r: r['similarity'], reverse=True)[:self.num_representatives]
+        for rep in kept:
+            # Store a pruned copy of each representative's vector for re-scoring later
+            if isinstance(rep['vector'], dict):
+                vector = rep['vector']
+                strongest = sorted(vector, key=lambda i: abs(vector[i]), reverse=True)
+                rep['vector'] = [[idx, vector[idx]] for idx in strongest[:self.max_centroid_terms]]
+        cluster['representatives'] = kept
+
+    def _compact(self, cluster: Dict) -> None:
+        """Trim a cluster's label terms, daily history and member list to their bounds."""
+        terms = cluster['terms']
+        if len(terms) > 2 * self.max_centroid_terms:
+            kept = sorted(terms, key=terms.get, reverse=True)[:self.max_centroid_terms]
+            cluster['terms'] = {phrase: terms[phrase] for phrase in kept}
+
+        daily_counts = cluster['daily_counts']
+        if len(daily_counts) > self.history_days:
+            kept = sorted(daily_counts, key=int)[-self.history_days:]
+            cluster['daily_counts'] = {day: daily_counts[day] for day in kept}
+
+        # Members are only needed to unassign posts when a small cluster is retired
+        if cluster['members'] is not None and cluster['size'] > self.retire_size:
+            cluster['members'] = None
+
+    def _update_cluster(self, cluster_id: int, members: List[Tuple[Dict, Dict, Dict]]) -> None:
+        """Fold a batch of assigned posts into a cluster's centroid and statistics."""
+        cluster = self.clusters[cluster_id]
+        old_size = cluster['size']
+        new_size = old_size + len(members)
+
+        # Running mean: previous centroid weighted by its size plus the new members
+        centroid = {idx: w * old_size / new_size for idx, w in cluster['centroid'].items()} if old_size else {}
+        for vector, _, _ in members:
+            for idx, weight in vector.items():
+                centroid[idx] = centroid.get(idx, 0.0) + weight / new_size
+        cluster['size'] = new_size
+        cluster['last_batch'] = self.batches_fitted
+        self._set_centroid(cluster_id, centroid)
+
+        terms = cluster['terms']
+        daily_counts = cluster['daily_counts']
+        candidates = list(cluster['representatives'])
+        for vector, phrases, post in members:
+            for phrase, weight in phrases.items():
+                terms[phrase] = terms.get(phrase, 0.0) + weight
+            day = str(int(post.get('created_utc', 0) // SECONDS_PER_DAY))
+            daily_counts[day] = daily_counts.get(day, 0) + 1
+            if cluster['members'] is not None:
+                cluster['members'].append(post['id'])
+            candidates.append({
+                'id': post['id'],
+                'title': post.get('title', ''),
+                'url': post.get('url', ''),
+                'vector': vector
+            })
+
+        self._rank_representatives(cluster, candidates)
+        self._compact(cluster)
+
+    def _merge(self, source_id: int, target_id: int) -> None:
+        """Fold one cluster into another."""
+        source = self.clusters.pop(source_id)
+        target = self.clusters[target_id]
+        total = source['size'] + target['size']
+
+        centroid = {idx: w * target['size'] / total for idx, w in target['centroid'].items()}
+        for idx, weight in source['centroid'].items():
+            centroid[idx] = centroid.get(idx, 0.0) + weight * source['size'] / total
+
+        for idx in source['centroid']:
+            postings = self.postings.get(idx)
+            if postings is not None:
+                postings.pop(source_id, None)
+                if not postings:
+                    del self.postings[idx]
+
+        target['size'] = total
+        target['last_batch'] = max(source['last_batch'], target['last_batch'])
+        self._set_centroid(target_id, centroid)
+
+        for phrase, weight in source['terms'].items():
+            target['terms'][phrase] = target['terms'].get(phrase, 0.0) + weight
+        for day, count in source['daily_counts'].items():
+            target['daily_counts'][day] = target['daily_counts'].get(day, 0) + count
+
+        if source['members'] is not None:
+            for post_id in source['members']:
+                self.assignments[post_id] = target_id
+            if target['members'] is not None:
+                target['members'].extend(source['members'])
+        else:
+            self.merged_into[source_id] = target_id
+            target['members'] = None
+
+        self._rank_representatives(target, target['representatives'] + source['representatives'])
+        self._compact(target)
+
+    def _retire(self, cluster_id: int) -> None:
+        """Drop a small stale cluster and unassign its posts so they can be clustered again later."""
+        self._unindex(cluster_id)
+        cluster = self.clusters.pop(cluster_id)
+        for post_id in cluster['members'] or []:
+            self.assignments.pop(post_id, None)
+
+    def _maintain(self) -> None:
+        """Merge clusters that describe the same theme and retire small stale ones."""
+        merged = retired = 0
+
+        for cluster_id in sorted(self.clusters, key=lambda cid: self.clusters[cid]['size']):
+            if cluster_id not in self.clusters:
+                continue
+            cluster = self.clusters[cluster_id]
+            stale = self.batches_fitted - cluster['last_batch'] >= self.stale_batches
+
+            # A stale cluster is folded in like a post would be; active ones need a closer match
+            other_id, similarity = self._nearest(cluster['centroid'], exclude=cluster_id)
+            threshold = self.similarity_threshold if stale else self.merge_threshold
+            if other_id is not None and similarity >= threshold:
+                # Keep the larger cluster's identity so its ID stays stable for reviewers
+                if self.clusters[other_id]['size'] >= cluster['size']:
+                    self._merge(cluster_id, other_id)
+                else:
+                    self._merge(other_id, cluster_id)
+                merged += 1
+            elif stale and cluster['size'] <= self.retire_size:
+                self._retire(cluster_id)
+                retired += 1
+
+        if merged or retired:
+            logger.info(f"Cluster maintenance: merged {merged}, retired {retired}, "
+                        f"{len(self.clusters)} clusters remain")
+
+    def _fit_batch(self, batch: List[Dict]) -> int:
+        """Assign one mini-batch of posts, then update the affected centroids."""
+        self.batches_fitted += 1
+
+        # Count document frequencies for the whole batch first so terms shared
+        # within the batch already clear min_df
+        prepared = []
+        for post in batch:
+            phrases = self.vectorizer.phrases(post.get('title', ''), post.get('selftext', ''))
+            features = self.vectorizer.transform(phrases)
+            for idx in features:
+                self.doc_freq[idx] += 1
+            self.num_docs += 1
+            prepared.append((post, phrases, features))
+
+        members: Dict[int, List[Tuple[Dict, Dict, Dict]]] = defaultdict(list)
+        assigned = 0
+
+        for post, phrases, features in prepared:
+            vector = self._weight(features)
+            if not vector:
+                continue
+
+            cluster_id, similarity = self._nearest(vector)
+            if similarity < self.similarity_threshold and len(self.clusters) < self.max_clusters:
+                cluster_id = self._new_cluster(vector)
+            if cluster_id is None:
+                continue
+
+            members[cluster_id].append((vector, phrases, post))
+            self.assignments[post['id']] = cluster_id
+            assigned += 1
+
+        for cluster_id, cluster_members in members.items():
+            self._update_cluster(cluster_id, cluster_members)
+
+        if (self.batches_fitted % self.maintenance_interval == 0
+                or len(self.clusters) >= self.max_clusters):
+            self._maintain()
+
+        return assigned
+
+    def cluster_of(self, post_id: str) -> Optional[int]:
+        """Return the current cluster of a post, following merges."""
+        cluster_id = self.assignments.get(post_id)
+        while cluster_id in self.merged_into:
+            cluster_id = self.merged_into[cluster_id]
+        return cluster_id
+
+    def partial_fit(self, posts: Iterable[Dict]) -> int:
+        """
+        Update the clusters with new idea candidates.
+
+        Posts that were already assigned in an earlier run are skipped.
+
+        Args:
+            posts: Post dictionaries as produced by RedditIdeaScraper
+
+        Returns:
+            Number of newly assigned posts
+        """
+        assigned = 0
+        batch = []
+        queued = set()
+
+        for post in posts:
+            if post['id'] in self.assignments or post['id'] in queued:
+                continue
+            queued.add(post['id'])
+            batch.append(post)
+            if len(batch) >= self.batch_size:
+                assigned += self._fit_batch(batch)
+                batch = []
+
+        if batch:
+            assigned += self._fit_batch(batch)
+
+        logger.info(f"Clustered {assigned} new candidates into {len(self.clusters)} clusters")
+        return assigned
+
+    def label(self, cluster_id: int, num_terms: int = 3) -> str:
+        """
+        Build a human-readable label from a cluster's most frequent phrases.
+
+        Bigrams are preferred over single words since they describe problems better.
+        """
+        terms = self.clusters[cluster_id]['terms']
+        ranked = sorted(terms, key=lambda t: terms[t] * (2 if ' ' in t else 1), reverse=True)
+
+        label_terms = []
+        for term in ranked:
+            # Skip words already covered by a chosen phrase
+            if any(term in chosen for chosen in label_terms):
+                continue
+            label_terms.append(term)
+            if len(label_terms) == num_terms:
+                break
+        return ', '.join(label_terms)
+
+    def growth(self, cluster_id: int, days: int = 7, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Compare a cluster's new members in the last N days with the N days before.
+
+        Args:
+            cluster_id: Cluster to inspect
+            days: Window length in days
+            now: Optional Unix timestamp marking the end of the window
+
+        Returns:
+            Dictionary with 'recent' and 'previous' post counts
+        """
+        end_day = int((now if now is not None else datetime.now().timestamp()) // SECONDS_PER_DAY)
+        recent = previous = 0
+        for day, count in self.clusters[cluster_id]['daily_counts'].items():
+            age = end_day - int(day)
+            if 0 <= age < days:
+                recent += count
+            elif days <= age < 2 * days:
+                previous += count
+        return {'recent': recent, 'previous': previous}
+
+    def summary(self, top: Optional[int] = None, min_size: int = 1, days: int = 7) -> List[Dict]:
+        """
+        Describe clusters from largest to smallest.
+
+        Args:
+            top: Optional maximum number of clusters to return
+            min_size: Smallest cluster size to include
+            days: Window length in days for growth metrics
+
+        Returns:
+            List of dictionaries with label, size, growth and representative posts
+        """
+        ranked = sorted(
+            (cid for cid, cluster in self.clusters.items() if cluster['size'] >= min_size),
+            key=lambda cid: self.clusters[cid]['size'],
+            reverse=True
+        )
+        if top is not None:
+            ranked = ranked[:top]
+
+        return [{
+            'cluster_id': cid,
+            'label': self.label(cid),
+            'size': self.clusters[cid]['size'],
+            'growth': self.growth(cid, days=days),
+            'representatives': [
+                {key: value for key, value in rep.items() if key != 'vector'}
+                for rep in self.clusters[cid]['representatives']
+            ]
+        } for cid in ranked]
+
+    def representative_posts(self, posts: Iterable[Dict], min_size: int = 1) -> List[Dict]:
+        """
+        Pick one post per theme from a set of candidates, e.g. for Airtable or LLM enrichment.
+
+        Args:
+            posts: Clustered post dictionaries to choose from
+            min_size: Smallest cluster size to include
+
+        Returns:
+            The most representative available post of each cluster, largest clusters first
+        """
+        by_cluster: Dict[int, Dict[str, Dict]] = defaultdict(dict)
+        for post in posts:
+            cluster_id = self.cluster_of(post['id'])
+            if cluster_id is not None:
+                by_cluster[cluster_id][post['id']] = post
+
+        chosen = []
+        for theme in self.summary(min_size=min_size):
+            members = by_cluster.get(theme['cluster_id'])
+            if not members:
+                continue
+            # Prefer the cluster's best representatives, else any member from this batch
+            post_id = next((rep['id'] for rep in theme['representatives'] if rep['id'] in members),
+                           next(iter(members)))
+            chosen.append(dict(members[post_id], cluster_id=theme['cluster_id'],
+                               cluster_label=theme['label'], cluster_size=theme['size']))
+
+        return chosen
+
+    def to_dict(self) -> Dict:
+        """Serialize the clusterer state to a JSON-compatible dictionary."""
+        return {
+            'similarity_threshold': self.similarity_threshold,
+            'max_clusters': self.max_clusters,
+            'max_centroid_terms': self.max_centroid_terms,
+            'batch_size': self.batch_size,
+            'num_representatives': self.num_representatives,
+            'history_days': self.history_days,
+            'min_df': self.min_df,
+            'min_df_ratio': self.min_df_ratio,
+            'merge_threshold': self.merge_threshold,
+            'retire_size': self.retire_size,
+            'stale_batches': self.stale_batches,
+            'maintenance_interval': self.maintenance_interval,
+            'n_features': self.vectorizer.n_features,
+            'doc_freq': base64.b64encode(zlib.compress(self.doc_freq.tobytes())).decode('ascii'),
+            'num_docs': self.num_docs,
+            'batches_fitted': self.batches_fitted,
+            'next_cluster_id': self.next_cluster_id,
+            'assignments': self.assignments,
+            'merged_into': self.merged_into,
+            'clusters': {
+                str(cid): dict(cluster, centroid=[[idx, w] for idx, w in cluster['centroid'].items()])
+                for cid, cluster in self.clusters.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IdeaClusterer':
+        """Rebuild a clusterer from a dictionary produced by to_dict."""
+        clusterer = cls(
+            similarity_threshold=data['similarity_threshold'],
+            max_clusters=data['max_clusters'],
+            max_centroid_terms=data['max_centroid_terms'],
+            batch_size=data['batch_size'],
+            num_representatives=data['num_representatives'],
+            history_days=data['history_days'],
+            min_df=data['min_df'],
+            min_df_ratio=data['min_df_ratio'],
+            merge_threshold=data['merge_threshold'],
+            retire_size=data['retire_size'],
+            stale_batches=data['stale_batches'],
+            maintenance_interval=data['maintenance_interval'],
+            vectorizer=HashingVectorizer(n_features=data['n_features'])
+        )
+        clusterer.doc_freq = array('I')
+        clusterer.doc_freq.frombytes(zlib.decompress(base64.b64decode(data['doc_freq'])))
+        clusterer.num_docs = data['num_docs']
+        clusterer.batches_fitted = data['batches_fitted']
+        clusterer.next_cluster_id = data['next_cluster_id']
+        clusterer.assignments = data['assignments']
+        clusterer.merged_into = {int(source): target for source, target in data['merged_into'].items()}
+
+        for cid, cluster in data['clusters'].items():
+            cluster_id = int(cid)
+            cluster['centroid'] = {int(idx): w for idx, w in cluster['centroid']}
+            clusterer.clusters[cluster_id] = cluster
+            for idx, weight in cluster['centroid'].items():
+                clusterer.postings[idx][cluster_id] = weight
+
+        return clusterer
+
+    def save(self, path: str = DEFAULT_CLUSTERS_FILE) -> None:
+        """
+        Save the clusterer state to disk.
+
+        Args:
+            path: Location of the clusters file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logger.info(f"Cluster state saved to {path}")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CLUSTERS_FILE) -> 'IdeaClusterer':
+        """
+        Load the clusterer state from disk, starting empty if there is none.
+
+        Args:
+            path: Location of the clusters file
+
+        Returns:
+            IdeaClusterer instance
+        """
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load cluster state from {path}: {e}")
+            return cls()
+
+
+def print_themes(themes: List[Dict]) -> None:
+    """Print a table of idea themes."""
+    if not themes:
+        print("🗂️  No idea themes yet")
+        return
+
+    for i, theme in enumerate(themes, 1):
+        growth = theme['growth']
+        print(f"{i}. {theme['label']} ({theme['size']} posts, "
+              f"+{growth['recent']} recent vs {growth['previous']} before)")
+        for rep in theme['representatives'][:1]:
+            print(f"   e.g. {rep['title'][:80]}")
+            print(f"   URL: {rep['url']}")
+        print("-" * 50)
+
+
+def main():
+    """Cluster idea candidates from a results file and print the largest themes."""
+    parser = argparse.ArgumentParser(description="Group idea candidates into themes.")
+    parser.add_argument('files', nargs='*', help="Scan result JSON files to add to the clusters")
+    parser.add_argument('--top', type=int, default=20, help="Number of themes to show")
+    args = parser.parse_args()
+
+    clusterer = IdeaClusterer.load()
+    for filename in args.files:
+        with open(filename, 'r', encoding='utf-8') as f:
+            posts = json.load(f)
+        candidates = [post for post in posts if post.get('is_idea_candidate')]
+        print(f"📥 {filename}: clustered {clusterer.partial_fit(candidates)} new candidates")
+    if args.files:
+        clusterer.save()
+
+    print(f"\n🗂️  Top Idea Themes ({len(clusterer.clusters)} total):")
+    print("-" * 50)
+    print_themes(clusterer.summary(top=args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -10,14 +10,24 @@ License: MIT
 """
 
 import os
+import argparse
 import praw
+import prawcore
 from dotenv import load_dotenv
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 import logging
-from typing import List, Dict, Optional
+import random
+import threading
+import time
+from typing import Any, Callable, List, Dict, Optional, Set, Tuple
 import json
 
+from engagement_tracker import EngagementTracker, print_velocity
+from idea_clustering import IdeaClusterer
+from trend_engine import TrendEngine, print_rising
+
 # Load environment variables
 load_dotenv()
 
@@ -33,6 +43,318 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Sweep state persisted between runs
+CHECKPOINT_FILE = os.path.join('data', 'sweep_checkpoint.json')
+CIRCUIT_BREAKER_FILE = os.path.join('data', 'circuit_breaker.json')
+
+BACKFILL_DIR = os.path.join('data', 'backfill')
+BACKFILL_JOB_FILE = os.path.join(BACKFILL_DIR, 'job.json')
+
+# Reddit listing time filters and how far back each one reaches (None = no limit)
+TIME_FILTER_WINDOWS = [
+    ('day', 24 * 60 * 60),
+    ('week', 7 * 24 * 60 * 60),
+    ('month', 31 * 24 * 60 * 60),
+    ('year', 366 * 24 * 60 * 60),
+    ('all', None),
+]
+
+# Reddit returns at most 100 items per listing request
+LISTING_PAGE_SIZE = 100
+
+# Reddit's info endpoint accepts at most 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+# HTTP status codes worth retrying (rate limiting and server-side errors)
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _load_json(path: str, default: Any) -> Any:
+    """Load a JSON state file, falling back to a default if missing or corrupt."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable state file {path}: {e}")
+        return default
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temporary file and move it into place so a crash never leaves a torn file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Return True for network failures and 429/5xx responses that are worth retrying."""
+    if isinstance(error, prawcore.exceptions.RequestException):
+        return True
+    if isinstance(error, prawcore.exceptions.ResponseException):
+        return error.response.status_code in TRANSIENT_STATUS_CODES
+    return False
+
+
+def _is_subreddit_unavailable(error: Exception) -> bool:
+    """Return True for responses meaning the subreddit itself is private, banned or renamed."""
+    return isinstance(error, (
+        prawcore.exceptions.Forbidden,
+        prawcore.exceptions.NotFound,
+        prawcore.exceptions.Redirect,
+        prawcore.exceptions.UnavailableForLegalReasons
+    ))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Extract the Retry-After delay (in seconds) from a rate-limited response, if present."""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class SweepCheckpoint:
+    """Persists completed subreddits and their posts so an interrupted sweep can resume."""
+
+    def __init__(self, path: str = CHECKPOINT_FILE, posts_per_subreddit: Optional[int] = None,
+                 max_age_hours: float = 6):
+        """
+        Load an existing checkpoint or start a fresh one.
+
+        Args:
+            path: Location of the checkpoint file
+            posts_per_subreddit: Sweep size; a checkpoint written with a different size is discarded
+            max_age_hours: Checkpoints started longer ago than this are discarded, since
+                their posts no longer reflect what is hot
+        """
+        self.path = path
+        state = _load_json(path, None)
+        
+        if state and self._age_hours(state) > max_age_hours:
+            logger.info(f"Discarding sweep checkpoint started at {state.get('started_at')}: "
+                        f"older than {max_age_hours} hours")
+            state = None
+        
+        if state and state.get('posts_per_subreddit') == posts_per_subreddit:
+            self.state = state
+            logger.info(f"Resuming sweep from checkpoint with {len(state['results'])} completed subreddits")
+        else:
+            self.state = {
+                'started_at': datetime.now().isoformat(),
+                'posts_per_subreddit': posts_per_subreddit,
+                'results': {}
+            }
+    
+    @staticmethod
+    def _age_hours(state: Dict) -> float:
+        """Return how many hours ago a checkpoint was started, or infinity if unknown."""
+        try:
+            started_at = datetime.fromisoformat(state['started_at'])
+        except (KeyError, TypeError, ValueError):
+            return float('inf')
+        return (datetime.now() - started_at).total_seconds() / 3600
+    
+    def is_complete(self, subreddit: str) -> bool:
+        """Return True if the subreddit was already scanned in this sweep."""
+        return subreddit in self.state['results']
+    
+    def mark_complete(self, subreddit: str, posts: List[Dict]) -> None:
+        """Record a finished subreddit and flush the checkpoint to disk."""
+        self.state['results'][subreddit] = posts
+        _write_json_atomic(self.path, self.state)
+    
+    def get_posts(self, subreddit: str) -> List[Dict]:
+        """Return the checkpointed posts for a subreddit."""
+        return self.state['results'].get(subreddit, [])
+    
+    def clear(self) -> None:
+        """Remove the checkpoint once the sweep results have been saved."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        logger.info("Sweep checkpoint cleared")
+
+
+class CircuitBreaker:
+    """Skips subreddits that keep failing (private, banned, renamed) for a cool-down period."""
+
+    def __init__(self, path: str = CIRCUIT_BREAKER_FILE, failure_threshold: int = 3,
+                 cooldown_seconds: int = 24 * 60 * 60):
+        """
+        Load circuit breaker state shared across runs.
+
+        Args:
+            path: Location of the circuit breaker state file
+            failure_threshold: Consecutive failures before a subreddit is skipped
+            cooldown_seconds: How long a tripped subreddit is skipped
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = _load_json(path, {})
+    
+    def is_open(self, subreddit: str) -> bool:
+        """Return True if the subreddit is in its cool-down period and should be skipped."""
+        entry = self.state.get(subreddit)
+        return bool(entry) and time.time() < entry.get('open_until', 0)
+    
+    def record_success(self, subreddit: str) -> None:
+        """Reset the failure count after a successful scan."""
+        if self.state.pop(subreddit, None) is not None:
+            _write_json_atomic(self.path, self.state)
+    
+    def record_failure(self, subreddit: str, error: Exception) -> None:
+        """
+        Count a failed scan and trip the breaker once the threshold is reached.
+        
+        After a cool-down expires the subreddit gets a single trial scan; another
+        failure trips the breaker again straight away.
+        """
+        entry = self.state.setdefault(subreddit, {'failures': 0, 'open_until': 0})
+        entry['failures'] += 1
+        entry['last_error'] = str(error)
+        
+        if entry['failures'] >= self.failure_threshold:
+            entry['open_until'] = time.time() + self.cooldown_seconds
+            logger.warning(f"Circuit opened for r/{subreddit} after {entry['failures']} failures")
+        
+        _write_json_atomic(self.path, self.state)
+
+
+class BudgetExhausted(Exception):
+    """Raised when a backfill job has used up its request cap."""
+
+
+class RateBudget:
+    """Thread-safe request budget shared by parallel backfill workers."""
+
+    def __init__(self, requests_per_minute: int = 60, max_requests: Optional[int] = None):
+        """
+        Configure the request budget.
+
+        Args:
+            requests_per_minute: Sustained request rate, kept below Reddit's 100 QPM limit
+            max_requests: Optional hard cap on requests for the whole job
+        """
+        self.interval = 60.0 / requests_per_minute
+        self.max_requests = max_requests
+        self.requests_made = 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> bool:
+        """
+        Wait for the next request slot.
+        
+        Returns:
+            False once the job's request cap is exhausted, True otherwise
+        """
+        with self._lock:
+            if self.max_requests is not None and self.requests_made >= self.max_requests:
+                return False
+            self.requests_made += 1
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        
+        if wait > 0:
+            time.sleep(wait)
+        return True
+    
+    @property
+    def exhausted(self) -> bool:
+        """Return True once the job's request cap has been used up."""
+        return self.max_requests is not None and self.requests_made >= self.max_requests
+
+
+class BackfillProgress:
+    """Stored posts and completed time slices for one subreddit's historical backfill."""
+
+    def __init__(self, subreddit: str, start_utc: float, end_utc: Optional[float] = None,
+                 directory: str = BACKFILL_DIR):
+        """
+        Load progress for a subreddit, resetting it if the requested date range changed.
+
+        Args:
+            subreddit: Subreddit being backfilled
+            start_utc: Start of the date range (Unix timestamp)
+            end_utc: End of the date range (Unix timestamp); when omitted, the
+                stored end of a job with the same start is reused, or now for a new job
+            directory: Directory holding backfill posts and progress files
+        """
+        self.posts_path = os.path.join(directory, f"{subreddit}.jsonl")
+        self.progress_path = os.path.join(directory, f"{subreddit}.progress.json")
+        
+        state = _load_json(self.progress_path, None)
+        if (state and state.get('start_utc') == start_utc
+                and (end_utc is None or state.get('end_utc') == end_utc)):
+            self.state = state
+        else:
+            if end_utc is None:
+                end_utc = time.time()
+            self.state = {'start_utc': start_utc, 'end_utc': end_utc, 'completed_slices': []}
+        
+        self.known_ids = self._load_known_ids()
+    
+    @property
+    def end_utc(self) -> float:
+        """Return the end of the date range this progress covers."""
+        return self.state['end_utc']
+    
+    def _load_known_ids(self) -> Set[str]:
+        """Collect the IDs of posts already stored for this subreddit."""
+        known_ids = set()
+        if not os.path.exists(self.posts_path):
+            return known_ids
+        
+        with open(self.posts_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    known_ids.add(json.loads(line)['id'])
+                except (ValueError, KeyError):
+                    # A crash mid-append can leave a truncated last line
+                    continue
+        return known_ids
+    
+    def is_complete(self, slice_key: str) -> bool:
+        """Return True if the time slice was already fetched."""
+        return slice_key in self.state['completed_slices']
+    
+    def store_slice(self, slice_key: str, posts: List[Dict]) -> List[Dict]:
+        """
+        Append unseen posts to the store, then mark the slice complete.
+        
+        Args:
+            slice_key: Identifier of the fetched time slice
+            posts: Posts returned for the slice
+            
+        Returns:
+            The posts that were not already stored
+        """
+        new_posts = []
+        for post in posts:
+            if post['id'] not in self.known_ids:
+                self.known_ids.add(post['id'])
+                new_posts.append(post)
+        
+        if new_posts:
+            os.makedirs(os.path.dirname(self.posts_path), exist_ok=True)
+            with open(self.posts_path, 'a', encoding='utf-8') as f:
+                for post in new_posts:
+                    f.write(json.dumps(post, ensure_ascii=False) + '\n')
+        
+        self.state['completed_slices'].append(slice_key)
+        _write_json_atomic(self.progress_path, self.state)
+        return new_posts
+
 
 class RedditIdeaScraper:
     """Main class for scraping Reddit to find startup ideas."""
@@ -78,6 +400,13 @@ class RedditIdeaScraper:
             '"inefficient process"'
         ]
         
+        # Keywords in post text indicating pain points
+        self.pain_indicators = [
+            'problem', 'issue', 'pain', 'frustrated', 'hate', 'difficult',
+            'manual', 'time-consuming', 'inefficient', 'tedious', 'boring',
+            'looking for', 'need help', 'solution', 'tool', 'app', 'software'
+        ]
+        
         # Map subreddits to subject categories
         self.subreddit_to_subject = {
             # Development
@@ -126,8 +455,16 @@ class RedditIdeaScraper:
             'ecommerce': 'Ecommerce',
         }
         
+        # Retry settings for transient Reddit API errors
+        self.max_retries = 4
+        self.backoff_base = 2.0
+        self.backoff_cap = 60.0
+        
         self.reddit = None
         self._initialize_reddit()
+        
+        # Backfill workers each get their own client; PRAW instances are not thread-safe
+        self._worker_clients = threading.local()
     
     def _initialize_reddit(self) -> None:
         """Initialize Reddit API client."""
@@ -145,6 +482,24 @@ class RedditIdeaScraper:
             logger.error(f"Failed to initialize Reddit client: {e}")
             raise
     
+    def _worker_reddit(self, budget: RateBudget) -> praw.Reddit:
+        """
+        Return the Reddit client owned by the calling thread, creating it on first use.
+        
+        Args:
+            budget: Request budget charged for a new client's OAuth token fetch
+        """
+        reddit = getattr(self._worker_clients, 'reddit', None)
+        if reddit is None:
+            if not budget.acquire():
+                raise BudgetExhausted()
+            reddit = self._worker_clients.reddit = praw.Reddit(
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                user_agent=self.user_agent
+            )
+        return reddit
+    
     def scan_subreddit(self, subreddit_name: str, limit: int = 100) -> List[Dict]:
         """
         Scan a specific subreddit for potential ideas.
@@ -157,31 +512,84 @@ class RedditIdeaScraper:
             List of dictionaries containing post data
         """
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            posts = []
-            
-            for post in subreddit.hot(limit=limit):
-                post_data = {
-                    'id': post.id,
-                    'title': post.title,
-                    'url': f"https://reddit.com{post.permalink}",
-                    'score': post.score,
-                    'num_comments': post.num_comments,
-                    'created_utc': post.created_utc,
-                    'subreddit': subreddit_name,
-                    'subject': self.subreddit_to_subject.get(subreddit_name, 'Other'),
-                    'selftext': post.selftext[:500] if post.selftext else '',
-                    'is_idea_candidate': self._is_idea_candidate(post.title, post.selftext)
-                }
-                posts.append(post_data)
-            
-            logger.info(f"Scanned {subreddit_name}: found {len(posts)} posts")
-            return posts
-            
+            return self._call_with_retries(
+                lambda: self._fetch_subreddit_posts(subreddit_name, limit),
+                f"r/{subreddit_name}"
+            )
         except Exception as e:
             logger.error(f"Error scanning subreddit {subreddit_name}: {e}")
             return []
     
+    def _fetch_subreddit_posts(self, subreddit_name: str, limit: int) -> List[Dict]:
+        """
+        Fetch hot posts from a subreddit, raising on any API error.
+        
+        Args:
+            subreddit_name: Name of the subreddit to scan
+            limit: Maximum number of posts to analyze
+            
+        Returns:
+            List of dictionaries containing post data
+        """
+        subreddit = self.reddit.subreddit(subreddit_name)
+        posts = [self._build_post_data(post, subreddit_name) for post in subreddit.hot(limit=limit)]
+        
+        logger.info(f"Scanned {subreddit_name}: found {len(posts)} posts")
+        return posts
+    
+    def _build_post_data(self, post, subreddit_name: str) -> Dict:
+        """
+        Convert a PRAW submission into the post dictionary stored in results.
+        
+        Args:
+            post: PRAW submission
+            subreddit_name: Name of the subreddit the post was found in
+            
+        Returns:
+            Dictionary containing post data
+        """
+        matched_indicators = self._matched_indicators(post.title, post.selftext)
+        return {
+            'id': post.id,
+            'title': post.title,
+            'url': f"https://reddit.com{post.permalink}",
+            'score': post.score,
+            'num_comments': post.num_comments,
+            'created_utc': post.created_utc,
+            'subreddit': subreddit_name,
+            'subject': self.subreddit_to_subject.get(subreddit_name, 'Other'),
+            'selftext': post.selftext[:500] if post.selftext else '',
+            'is_idea_candidate': bool(matched_indicators),
+            'pain_indicators': matched_indicators,
+            # When score and num_comments were read, so checkpointed posts keep their true timing
+            'observed_at': time.time()
+        }
+    
+    def _call_with_retries(self, func: Callable[[], Any], description: str) -> Any:
+        """
+        Call a Reddit API operation, retrying transient errors with jittered exponential backoff.
+        
+        Args:
+            func: Zero-argument callable performing the API work
+            description: Label used in log messages
+            
+        Returns:
+            Whatever func returns
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func()
+            except Exception as e:
+                if not _is_transient_error(e) or attempt == self.max_retries:
+                    raise
+                
+                # Full jitter keeps concurrent runs from retrying in lockstep
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+                delay = max(delay, _retry_after(e) or 0)
+                logger.warning(f"Transient error on {description} (attempt {attempt + 1}): {e}; "
+                               f"retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
     def _is_idea_candidate(self, title: str, content: str) -> bool:
         """
         Determine if a post is a good candidate for idea generation.
@@ -193,23 +601,32 @@ class RedditIdeaScraper:
         Returns:
             True if post indicates a potential business opportunity
         """
-        text = f"{title} {content}".lower()
-        
-        # Check for pain point indicators
-        pain_indicators = [
-            'problem', 'issue', 'pain', 'frustrated', 'hate', 'difficult',
-            'manual', 'time-consuming', 'inefficient', 'tedious', 'boring',
-            'looking for', 'need help', 'solution', 'tool', 'app', 'software'
-        ]
+        return bool(self._matched_indicators(title, content))
+    
+    def _matched_indicators(self, title: str, content: str) -> List[str]:
+        """
+        Find the pain point indicators mentioned in a post.
         
-        return any(indicator in text for indicator in pain_indicators)
+        Args:
+            title: Post title
+            content: Post content
+            
+        Returns:
+            List of matched indicators
+        """
+        text = f"{title} {content or ''}".lower()
+        return [indicator for indicator in self.pain_indicators if indicator in text]
     
-    def scan_all_subreddits(self, posts_per_subreddit: int = 50) -> List[Dict]:
+    def scan_all_subreddits(self, posts_per_subreddit: int = 50,
+                            checkpoint: Optional[SweepCheckpoint] = None,
+                            breaker: Optional[CircuitBreaker] = None) -> List[Dict]:
         """
         Scan all target subreddits for ideas.
         
         Args:
             posts_per_subreddit: Number of posts to analyze per subreddit
+            checkpoint: Optional checkpoint; subreddits already in it are not rescanned
+            breaker: Optional circuit breaker used to skip repeatedly failing subreddits
             
         Returns:
             List of all discovered posts
@@ -217,23 +634,326 @@ class RedditIdeaScraper:
         all_posts = []
         
         for subreddit in self.target_subreddits:
+            if checkpoint and checkpoint.is_complete(subreddit):
+                all_posts.extend(checkpoint.get_posts(subreddit))
+                logger.info(f"Skipping r/{subreddit}: already in checkpoint")
+                continue
+            
+            if breaker and breaker.is_open(subreddit):
+                logger.info(f"Skipping r/{subreddit}: circuit open")
+                continue
+            
             try:
-                posts = self.scan_subreddit(subreddit, posts_per_subreddit)
-                all_posts.extend(posts)
-                logger.info(f"Completed scan of r/{subreddit}")
+                posts = self._call_with_retries(
+                    lambda: self._fetch_subreddit_posts(subreddit, posts_per_subreddit),
+                    f"r/{subreddit}"
+                )
             except Exception as e:
                 logger.error(f"Failed to scan r/{subreddit}: {e}")
+                # Outages and our own bugs must not trip the breaker for every subreddit
+                if breaker and _is_subreddit_unavailable(e):
+                    breaker.record_failure(subreddit, e)
                 continue
+            
+            if breaker:
+                breaker.record_success(subreddit)
+            if checkpoint:
+                checkpoint.mark_complete(subreddit, posts)
+            all_posts.extend(posts)
+            logger.info(f"Completed scan of r/{subreddit}")
         
         return all_posts
     
-    def save_results(self, posts: List[Dict], filename: str = None) -> None:
+    def _backfill_slices(self, start_utc: float, end_utc: float) -> Dict[str, Dict]:
+        """
+        Plan the listing requests that together cover a date range.
+        
+        Each listing stops at roughly 1000 items, so the range is covered by
+        the newest-first listing plus top and keyword-search listings for every
+        time filter window that overlaps it. Narrow windows recover recent posts
+        that wider windows drop past their cap.
+        
+        Args:
+            start_utc: Start of the date range (Unix timestamp)
+            end_utc: End of the date range (Unix timestamp)
+            
+        Returns:
+            Mapping of slice key to listing parameters
+        """
+        now = time.time()
+        slices = {'new': {'listing': 'new'}}
+        
+        for time_filter, span in TIME_FILTER_WINDOWS:
+            window_start = now - span if span else 0
+            if window_start >= end_utc:
+                continue
+            
+            slices[f"top:{time_filter}"] = {'listing': 'top', 'time_filter': time_filter}
+            for query in self.search_queries:
+                slices[f"search:{time_filter}:{query}"] = {
+                    'listing': 'search', 'time_filter': time_filter, 'query': query
+                }
+            
+            if window_start <= start_utc:
+                break
+        
+        return slices
+    
+    def _fetch_backfill_slice(self, subreddit_name: str, params: Dict, start_utc: float,
+                              end_utc: float, budget: RateBudget) -> List[Dict]:
+        """
+        Fetch one time slice of a subreddit's history, raising on any API error.
+        
+        Runs on a backfill worker thread with that thread's own Reddit client.
+        A request slot is taken from the budget before each listing page is
+        requested, and BudgetExhausted is raised once the job's cap is reached.
+        
+        Args:
+            subreddit_name: Name of the subreddit to backfill
+            params: Listing parameters from _backfill_slices
+            start_utc: Start of the date range (Unix timestamp)
+            end_utc: End of the date range (Unix timestamp)
+            budget: Shared request budget
+            
+        Returns:
+            Posts in the slice that fall inside the date range
+        """
+        subreddit = self._worker_reddit(budget).subreddit(subreddit_name)
+        newest_first = params['listing'] == 'new'
+        
+        if params['listing'] == 'new':
+            listing = subreddit.new(limit=None)
+        elif params['listing'] == 'top':
+            listing = subreddit.top(time_filter=params['time_filter'], limit=None)
+        else:
+            newest_first = True
+            listing = subreddit.search(params['query'], sort='new',
+                                       time_filter=params['time_filter'], limit=None)
+        
+        posts = []
+        listing = iter(listing)
+        count = 0
+        while True:
+            # The listing requests its next page lazily, so reserve the slot before pulling it
+            if count % LISTING_PAGE_SIZE == 0 and not budget.acquire():
+                raise BudgetExhausted()
+            post = next(listing, None)
+            if post is None:
+                break
+            count += 1
+            
+            if post.created_utc < start_utc:
+                if newest_first:
+                    break
+                continue
+            if post.created_utc <= end_utc:
+                posts.append(self._build_post_data(post, subreddit_name))
+        
+        return posts
+    
+    def backfill_subreddit(self, subreddit_name: str, start: datetime, end: Optional[datetime] = None,
+                           max_workers: int = 4, budget: Optional[RateBudget] = None,
+                           breaker: Optional[CircuitBreaker] = None) -> List[Dict]:
+        """
+        Backfill a subreddit's history over a date range.
+        
+        Time slices are fetched in parallel, one Reddit client per worker,
+        within the shared request budget. Posts are deduplicated against the subreddit's backfill store and every
+        finished slice is recorded, so an interrupted or budget-capped job
+        resumes where it stopped.
+        
+        Args:
+            subreddit_name: Name of the subreddit to backfill
+            start: Oldest post creation time to include
+            end: Newest post creation time to include (defaults to the end stored
+                by an earlier run with the same start, or now for a new job)
+            max_workers: Number of time slices fetched concurrently
+            budget: Optional shared request budget
+            breaker: Optional circuit breaker used to skip repeatedly failing subreddits
+            
+        Returns:
+            Newly stored posts
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            new_posts, _ = self._backfill(subreddit_name, start.timestamp(),
+                                          end.timestamp() if end else None,
+                                          executor, budget or RateBudget(), breaker)
+        return new_posts
+    
+    def _backfill(self, subreddit_name: str, start_utc: float, end_utc: Optional[float],
+                  executor: ThreadPoolExecutor, budget: RateBudget,
+                  breaker: Optional[CircuitBreaker]) -> Tuple[List[Dict], bool]:
+        """
+        Run backfill_subreddit over a range given as Unix timestamps.
+        
+        The executor's threads keep their Reddit clients between calls, so a
+        job that reuses one executor across subreddits creates each client once.
+        
+        Returns:
+            Tuple of the newly stored posts and whether every slice is now complete
+        """
+        if breaker and breaker.is_open(subreddit_name):
+            logger.info(f"Skipping backfill of r/{subreddit_name}: circuit open")
+            return [], False
+        
+        progress = BackfillProgress(subreddit_name, start_utc, end_utc)
+        end_utc = progress.end_utc
+        
+        pending = {
+            key: params for key, params in self._backfill_slices(start_utc, end_utc).items()
+            if not progress.is_complete(key)
+        }
+        logger.info(f"Backfilling r/{subreddit_name}: {len(pending)} slices pending")
+        
+        new_posts = []
+        last_error = None
+        exhausted = False
+        completed = 0
+        futures = {
+            executor.submit(
+                self._call_with_retries,
+                lambda params=params: self._fetch_backfill_slice(
+                    subreddit_name, params, start_utc, end_utc, budget
+                ),
+                f"r/{subreddit_name} {key}"
+            ): key
+            for key, params in pending.items()
+        }
+        
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                posts = future.result()
+            except BudgetExhausted:
+                exhausted = True
+                continue
+            except Exception as e:
+                logger.error(f"Backfill slice {key} of r/{subreddit_name} failed: {e}")
+                # Keep an unavailable-subreddit error over any other for the breaker
+                if last_error is None or _is_subreddit_unavailable(e):
+                    last_error = e
+                continue
+            new_posts.extend(progress.store_slice(key, posts))
+            completed += 1
+        
+        if exhausted:
+            logger.info(f"Request budget exhausted with {len(pending) - completed} slices of "
+                        f"r/{subreddit_name} left; rerun to resume")
+        
+        if breaker:
+            if last_error is None and not exhausted:
+                breaker.record_success(subreddit_name)
+            elif _is_subreddit_unavailable(last_error):
+                breaker.record_failure(subreddit_name, last_error)
+        
+        logger.info(f"Backfill of r/{subreddit_name}: stored {len(new_posts)} new posts")
+        return new_posts, completed == len(pending)
+    
+    def backfill_all_subreddits(self, days: int = 365, subreddits: Optional[List[str]] = None,
+                                max_workers: int = 4, max_requests: Optional[int] = None,
+                                breaker: Optional[CircuitBreaker] = None) -> List[Dict]:
+        """
+        Backfill the last N days of history for several subreddits.
+        
+        The job's date range is saved when it starts and reused by later runs
+        with the same number of days until every subreddit is complete, so a
+        job resumed on another day picks up its stored progress.
+        
+        Args:
+            days: Number of days of history to cover
+            subreddits: Subreddits to backfill (defaults to all target subreddits)
+            max_workers: Number of time slices fetched concurrently
+            max_requests: Optional cap on API requests for the whole job
+            breaker: Optional circuit breaker used to skip repeatedly failing subreddits
+            
+        Returns:
+            All newly stored posts
+        """
+        job = _load_json(BACKFILL_JOB_FILE, None)
+        if not job or job.get('days') != days:
+            end_utc = time.time()
+            job = {'days': days, 'start_utc': end_utc - days * 24 * 60 * 60, 'end_utc': end_utc}
+            _write_json_atomic(BACKFILL_JOB_FILE, job)
+        else:
+            logger.info(f"Resuming backfill job started {datetime.fromtimestamp(job['end_utc']).isoformat()}")
+        
+        budget = RateBudget(max_requests=max_requests)
+        
+        all_posts = []
+        finished = True
+        # One pool for the whole job, so each worker's Reddit client is created only once
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for subreddit in subreddits or self.target_subreddits:
+                if budget.exhausted:
+                    logger.warning("Backfill request budget exhausted; rerun to resume")
+                    finished = False
+                    break
+                posts, complete = self._backfill(subreddit, job['start_utc'], job['end_utc'],
+                                                 executor, budget, breaker)
+                all_posts.extend(posts)
+                finished = finished and complete
+        
+        if finished:
+            # The next run starts a fresh job ending at that time
+            os.remove(BACKFILL_JOB_FILE)
+        
+        return all_posts
+    
+    def refresh_tracked_posts(self, tracker: EngagementTracker, max_age_hours: float = 72,
+                              max_posts: Optional[int] = None) -> int:
+        """
+        Re-poll engagement for tracked posts in batches via Reddit's info endpoint.
+        
+        Up to 100 posts are refreshed per request, so a thousand tracked posts
+        cost about ten requests.
+        
+        Args:
+            tracker: Engagement tracker holding the posts to refresh
+            max_age_hours: Posts older than this are no longer refreshed
+            max_posts: Optional cap on the number of posts refreshed
+            
+        Returns:
+            Number of posts refreshed
+        """
+        post_ids = tracker.ids_to_refresh(max_age_hours)[:max_posts]
+        refreshed = 0
+        
+        for start in range(0, len(post_ids), INFO_BATCH_SIZE):
+            fullnames = [f"t3_{post_id}" for post_id in post_ids[start:start + INFO_BATCH_SIZE]]
+            try:
+                submissions = self._call_with_retries(
+                    lambda: list(self.reddit.info(fullnames=fullnames)),
+                    f"info batch of {len(fullnames)} posts"
+                )
+            except Exception as e:
+                logger.error(f"Failed to refresh {len(fullnames)} posts: {e}")
+                continue
+            
+            observed_at = time.time()
+            for submission in submissions:
+                if tracker.record({
+                    'id': submission.id,
+                    'created_utc': submission.created_utc,
+                    'score': submission.score,
+                    'num_comments': submission.num_comments,
+                    'subreddit': submission.subreddit.display_name,
+                    'title': submission.title
+                }, observed_at):
+                    refreshed += 1
+        
+        logger.info(f"Refreshed engagement for {refreshed} of {len(post_ids)} tracked posts")
+        return refreshed
+    
+    def save_results(self, posts: List[Dict], filename: str = None) -> bool:
         """
         Save scanning results to a JSON file.
         
         Args:
             posts: List of post data to save
             filename: Optional custom filename
+            
+        Returns:
+            True if the file was written, False otherwise
         """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -243,8 +963,10 @@ class RedditIdeaScraper:
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(posts, f, indent=2, ensure_ascii=False)
             logger.info(f"Results saved to {filename}")
+            return True
         except Exception as e:
             logger.error(f"Failed to save results: {e}")
+            return False
     
     def get_idea_candidates(self, posts: List[Dict]) -> List[Dict]:
         """
@@ -259,37 +981,131 @@ class RedditIdeaScraper:
         return [post for post in posts if post['is_idea_candidate']]
 
 
-def main():
+def run_backfill(scraper: RedditIdeaScraper, args: argparse.Namespace) -> None:
+    """Run a historical backfill job from command-line arguments."""
+    subreddits = args.subreddits or scraper.target_subreddits
+    print(f"🕰️  Backfilling {args.backfill} days of history for {len(subreddits)} subreddits...")
+    
+    new_posts = scraper.backfill_all_subreddits(
+        days=args.backfill,
+        subreddits=subreddits,
+        max_workers=args.workers,
+        max_requests=args.max_requests,
+        breaker=CircuitBreaker()
+    )
+    
+    trends = TrendEngine.load()
+    trends.ingest_many(new_posts)
+    trends.save()
+    
+    print(f"✅ Stored {len(new_posts)} new posts")
+    print(f"💡 {len(scraper.get_idea_candidates(new_posts))} of them are idea candidates")
+    print(f"📁 Backfill data saved under {BACKFILL_DIR}/")
+
+
+def run_repoll(scraper: RedditIdeaScraper, args: argparse.Namespace) -> None:
+    """Refresh engagement for tracked posts and show the fastest-growing ones."""
+    tracker = EngagementTracker.load()
+    print(f"🔁 Re-polling tracked posts from the last {args.max_age_hours} hours...")
+    
+    refreshed = scraper.refresh_tracked_posts(tracker, max_age_hours=args.max_age_hours)
+    tracker.prune()
+    tracker.save()
+    print(f"✅ Refreshed {refreshed} posts")
+    
+    print("\n🚀 Fastest-Growing Posts:")
+    print("-" * 50)
+    print_velocity(tracker.top_by_velocity(top=10, max_age_hours=args.max_age_hours))
+
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Mine Reddit for startup ideas.")
+    parser.add_argument('--backfill', type=int, metavar='DAYS',
+                        help="Backfill this many days of history instead of scanning hot posts")
+    parser.add_argument('--subreddits', nargs='+', metavar='NAME',
+                        help="Subreddits to backfill (defaults to all target subreddits)")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Time slices fetched in parallel during a backfill")
+    parser.add_argument('--max-requests', type=int,
+                        help="Cap on API requests for a backfill job")
+    parser.add_argument('--repoll', action='store_true',
+                        help="Refresh engagement for tracked posts instead of scanning")
+    parser.add_argument('--max-age-hours', type=float, default=72,
+                        help="Only re-poll posts younger than this")
+    args = parser.parse_args(argv)
+    
     try:
         print("🚀 Starting Reddit Ideas Scraper...")
         
         scraper = RedditIdeaScraper()
         
+        if args.backfill:
+            run_backfill(scraper, args)
+            return 0
+        
+        if args.repoll:
+            run_repoll(scraper, args)
+            return 0
+        
+        checkpoint = SweepCheckpoint(posts_per_subreddit=30)
+        breaker = CircuitBreaker()
+        
         print(f"📊 Scanning {len(scraper.target_subreddits)} subreddits...")
-        all_posts = scraper.scan_all_subreddits(posts_per_subreddit=30)
+        all_posts = scraper.scan_all_subreddits(
+            posts_per_subreddit=30, checkpoint=checkpoint, breaker=breaker
+        )
         
         print(f"✅ Found {len(all_posts)} total posts")
         
         idea_candidates = scraper.get_idea_candidates(all_posts)
         print(f"💡 Identified {len(idea_candidates)} potential idea candidates")
         
-        # Save results
-        scraper.save_results(all_posts)
-        scraper.save_results(idea_candidates, "idea_candidates.json")
+        # Save results; keep the checkpoint until both files are safely written
+        saved_all = scraper.save_results(all_posts)
+        saved_candidates = scraper.save_results(idea_candidates, "idea_candidates.json")
+        if saved_all and saved_candidates:
+            checkpoint.clear()
+        
+        # Fold this sweep into the rolling trend counters
+        trends = TrendEngine.load()
+        trends.ingest_many(all_posts)
+        trends.save()
         
-        print("\n🎯 Top Idea Candidates:")
+        # Extend each post's engagement history with this sighting
+        tracker = EngagementTracker.load()
+        tracker.record_many(all_posts)
+        tracker.prune()
+        tracker.save()
+        
+        # Group candidates into themes so each underlying problem is reviewed once
+        clusterer = IdeaClusterer.load()
+        clusterer.partial_fit(idea_candidates)
+        clusterer.save()
+        idea_themes = clusterer.representative_posts(idea_candidates)
+        scraper.save_results(idea_themes, "idea_themes.json")
+        print(f"🗂️  Grouped candidates into {len(idea_themes)} themes")
+        
+        print("\n🎯 Top Idea Themes:")
         print("-" * 50)
-        for i, post in enumerate(idea_candidates[:10], 1):
+        for i, post in enumerate(idea_themes[:10], 1):
             print(f"{i}. {post['title'][:80]}...")
+            print(f"   Theme: {post['cluster_label']} ({post['cluster_size']} posts)")
             print(f"   Subreddit: r/{post['subreddit']}")
             print(f"   Score: {post['score']} | Comments: {post['num_comments']}")
             print(f"   URL: {post['url']}")
             print("-" * 50)
         
+        print("\n📈 Top Rising Pain Points (last 7 days):")
+        print("-" * 50)
+        print_rising(trends.top_rising(days=7, top=5))
+        
         print(f"\n📁 Results saved to:")
         print(f"   - reddit_scan_results_*.json (all posts)")
         print(f"   - idea_candidates.json (filtered candidates)")
+        print(f"   - idea_themes.json (one candidate per theme)")
+        print(f"   - data/trends.json (rolling trend counters)")
+        print(f"   - data/engagement.json (engagement history)")
         
     except Exception as e:
         logger.error(f"Main execution failed: {e}")
@@ -0,0 +1,86 @@
+"""Tests for streaming Airtable reads."""
+
+from itertools import islice
+
+import pytest
+
+pytest.importorskip('airtable')
+pytest.importorskip('dotenv')
+
+import airtable_manager  # noqa: E402
+
+
+class FakeTable:
+    """Serves numbered records in pages and records what was requested."""
+
+    def __init__(self, total=250, fail_after_pages=None):
+        self.total = total
+        self.fail_after_pages = fail_after_pages
+        self.options = None
+        self.pages_served = 0
+
+    def get_iter(self, **options):
+        self.options = options
+        page_size = options['page_size']
+        for start in range(0, self.total, page_size):
+            if self.fail_after_pages is not None and self.pages_served >= self.fail_after_pages:
+                raise RuntimeError("connection reset")
+            self.pages_served += 1
+            yield [{'id': f"rec{i}", 'fields': {'IdeaTitle': f"Idea {i}"}}
+                   for i in range(start, min(start + page_size, self.total))]
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setenv('AIRTABLE_API_KEY', 'key')
+    monkeypatch.setenv('AIRTABLE_BASE_ID', 'base')
+    monkeypatch.setenv('AIRTABLE_TABLE_NAME', 'Ideas')
+    monkeypatch.setattr(airtable_manager, 'Airtable', lambda *args, **kwargs: FakeTable())
+    return airtable_manager.AirtableIdeaManager()
+
+
+def test_iter_ideas_streams_every_page(manager):
+    records = list(manager.iter_ideas())
+
+    assert [r['id'] for r in records] == [f"rec{i}" for i in range(250)]
+    assert manager.airtable.options == {'page_size': 100}
+
+
+def test_iter_ideas_passes_projection_sort_and_limit(manager):
+    records = list(manager.iter_ideas(formula="{Status}='Backlog'", fields=['IdeaTitle'],
+                                      sort=['IdeaTitle'], limit=30))
+
+    assert len(records) == 30
+    assert manager.airtable.options == {
+        'page_size': 30, 'formula': "{Status}='Backlog'", 'fields': ['IdeaTitle'],
+        'sort': ['IdeaTitle'], 'max_records': 30
+    }
+
+
+def test_iter_ideas_trims_limit_across_pages(manager):
+    records = list(manager.iter_ideas(limit=150))
+
+    assert len(records) == 150
+    assert manager.airtable.pages_served == 2
+
+
+def test_iter_ideas_stops_fetching_when_caller_stops(manager):
+    first = list(islice(manager.iter_ideas(page_size=10), 5))
+
+    assert len(first) == 5
+    # The current page plus at most one prefetched page
+    assert manager.airtable.pages_served <= 2
+
+
+def test_iter_ideas_propagates_mid_stream_errors(manager):
+    manager.airtable = FakeTable(fail_after_pages=1)
+
+    with pytest.raises(RuntimeError):
+        list(manager.iter_ideas())
+
+
+def test_get_ideas_by_status_returns_empty_list_on_error(manager):
+    manager.airtable = FakeTable(fail_after_pages=1)
+
+    assert manager.get_ideas_by_status('Backlog') == []
+    assert manager.airtable.options['formula'] == "{Status}='Backlog'"
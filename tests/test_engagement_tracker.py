@@ -0,0 +1,127 @@
+"""Tests for engagement velocity tracking."""
+
+from engagement_tracker import SECONDS_PER_HOUR, EngagementTracker
+
+CREATED = 1700000000
+
+
+def observe(tracker, hours, score, comments, post_id='p1', **extra):
+    post = dict({'id': post_id, 'created_utc': CREATED, 'score': score,
+                 'num_comments': comments, 'title': 'Invoice pain', 'subreddit': 'smallbusiness'}, **extra)
+    return tracker.record(post, CREATED + hours * SECONDS_PER_HOUR)
+
+
+def test_points_round_trip_through_deltas():
+    tracker = EngagementTracker()
+    observe(tracker, 1, 5, 2)
+    observe(tracker, 3, 12, 9)
+    observe(tracker, 4, 10, 11)
+
+    assert tracker.points('p1') == [
+        (CREATED + 1 * SECONDS_PER_HOUR, 5, 2),
+        (CREATED + 3 * SECONDS_PER_HOUR, 12, 9),
+        (CREATED + 4 * SECONDS_PER_HOUR, 10, 11),
+    ]
+
+
+def test_observation_not_newer_than_last_is_ignored():
+    tracker = EngagementTracker()
+    assert observe(tracker, 2, 5, 2)
+    assert not observe(tracker, 2, 6, 3)
+    assert not observe(tracker, 1, 6, 3)
+    assert len(tracker.points('p1')) == 1
+
+
+def test_downsampling_keeps_first_and_last_and_absolute_values():
+    tracker = EngagementTracker(max_points=5)
+    hours = [1, 2, 2.1, 3, 5, 8, 8.2, 12]
+    for i, hour in enumerate(hours):
+        observe(tracker, hour, i * 10, i * 3)
+
+    points = tracker.points('p1')
+    assert len(points) == 5
+    assert points[0] == (CREATED + SECONDS_PER_HOUR, 0, 0)
+    assert points[-1] == (CREATED + 12 * SECONDS_PER_HOUR, 70, 21)
+    kept = {(t, s, c) for t, s, c in points}
+    expected = {(CREATED + int(h * SECONDS_PER_HOUR), i * 10, i * 3) for i, h in enumerate(hours)}
+    assert kept <= expected
+
+
+def test_velocity_and_acceleration_use_latest_intervals():
+    tracker = EngagementTracker()
+    observe(tracker, 1, 10, 2)
+    observe(tracker, 2, 30, 10)
+
+    metrics = tracker.metrics('p1', now=CREATED + 2 * SECONDS_PER_HOUR)
+    assert metrics['score_per_hour'] == 20.0
+    assert metrics['comments_per_hour'] == 8.0
+    assert metrics['comment_acceleration'] == 6.0
+
+
+def test_early_velocity_interpolates_across_window_end():
+    tracker = EngagementTracker(early_window_hours=6)
+    observe(tracker, 2, 1, 4)
+    observe(tracker, 10, 1, 20)
+
+    metrics = tracker.metrics('p1', now=CREATED + 11 * SECONDS_PER_HOUR)
+    assert metrics['early_comments_per_hour'] == 2.0
+
+
+def test_early_velocity_for_young_post_uses_latest_sighting():
+    tracker = EngagementTracker(early_window_hours=6)
+    observe(tracker, 2, 1, 6)
+
+    metrics = tracker.metrics('p1', now=CREATED + 3 * SECONDS_PER_HOUR)
+    assert metrics['early_comments_per_hour'] == 3.0
+
+
+def test_early_velocity_is_unknown_when_first_seen_after_window():
+    tracker = EngagementTracker(early_window_hours=6)
+    observe(tracker, 48, 10, 96)
+    observe(tracker, 60, 10, 100, post_id='p2')
+    observe(tracker, 1, 1, 5, post_id='p3')
+    observe(tracker, 8, 1, 19, post_id='p3')
+
+    now = CREATED + 61 * SECONDS_PER_HOUR
+    assert tracker.metrics('p1', now=now)['early_comments_per_hour'] is None
+    ranked = tracker.top_by_velocity(metric='early_comments_per_hour', now=now)
+    assert [m['id'] for m in ranked] == ['p3']
+
+
+def test_record_many_uses_each_posts_observation_time():
+    tracker = EngagementTracker()
+    posts = [
+        {'id': 'a', 'created_utc': CREATED, 'score': 1, 'num_comments': 1,
+         'observed_at': CREATED + SECONDS_PER_HOUR},
+        {'id': 'b', 'created_utc': CREATED, 'score': 1, 'num_comments': 1},
+    ]
+
+    assert tracker.record_many(posts, observed_at=CREATED + 5 * SECONDS_PER_HOUR) == 2
+    assert tracker.points('a')[0][0] == CREATED + SECONDS_PER_HOUR
+    assert tracker.points('b')[0][0] == CREATED + 5 * SECONDS_PER_HOUR
+
+
+def test_refresh_and_prune_respect_age():
+    tracker = EngagementTracker()
+    observe(tracker, 1, 1, 1, post_id='old', created_utc=CREATED - 40 * 24 * SECONDS_PER_HOUR)
+    observe(tracker, 1, 1, 1, post_id='new')
+    now = CREATED + 2 * SECONDS_PER_HOUR
+
+    assert tracker.ids_to_refresh(max_age_hours=72, now=now) == ['new']
+    assert tracker.prune(max_age_days=30, now=now) == 1
+    assert list(tracker.series) == ['new']
+
+
+def test_round_trip_preserves_series(tmp_path):
+    tracker = EngagementTracker(max_points=8)
+    observe(tracker, 1, 5, 2)
+    observe(tracker, 3, 12, 9)
+    path = str(tmp_path / 'engagement.json')
+    tracker.save(path)
+
+    loaded = EngagementTracker.load(path)
+
+    assert loaded.points('p1') == tracker.points('p1')
+    assert not observe(loaded, 3, 20, 20)
+    assert observe(loaded, 4, 20, 20)
+    assert loaded.points('p1')[-1] == (CREATED + 4 * SECONDS_PER_HOUR, 20, 20)
@@ -0,0 +1,122 @@
+"""Tests for incremental idea clustering."""
+
+from idea_clustering import HashingVectorizer, IdeaClusterer
+
+THEMES = {
+    'invoice': "invoice reconciliation takes hours every month",
+    'hiring': "hiring contractors background checks are slow",
+    'seo': "seo keyword research tools are too expensive",
+}
+
+
+def make_posts(theme, count, start=0):
+    return [{
+        'id': f"{theme}{i}",
+        'title': f"{THEMES[theme]} {['help', 'advice', 'ideas', 'rant'][i % 4]}",
+        'selftext': '',
+        'created_utc': 1700000000 + i * 3600,
+        'url': f"https://reddit.com/{theme}{i}"
+    } for i in range(start, start + count)]
+
+
+def mixed_posts(count):
+    """Interleave the themes the way a scan of several subreddits would."""
+    per_theme = [make_posts(theme, count) for theme in THEMES]
+    return [post for group in zip(*per_theme) for post in group]
+
+
+def test_vectorizer_is_deterministic_and_weights_title():
+    vectorizer = HashingVectorizer(n_features=2 ** 12)
+    phrases = vectorizer.phrases("invoice reconciliation", "invoice")
+
+    assert phrases['invoice'] > phrases['reconciliation']
+    assert vectorizer.transform(phrases) == HashingVectorizer(n_features=2 ** 12).transform(phrases)
+
+
+def test_posts_of_a_theme_share_a_cluster():
+    clusterer = IdeaClusterer(batch_size=8)
+    posts = mixed_posts(24)
+    clusterer.partial_fit(posts)
+
+    cluster_ids = {theme: {clusterer.cluster_of(post['id']) for post in make_posts(theme, 24)}
+                   for theme in THEMES}
+
+    assert all(len(ids) == 1 and None not in ids for ids in cluster_ids.values())
+    assert len(set.union(*cluster_ids.values())) == len(THEMES)
+
+
+def test_partial_fit_skips_assigned_posts():
+    clusterer = IdeaClusterer(batch_size=8)
+    posts = make_posts('invoice', 10)
+
+    assert clusterer.partial_fit(posts) == 10
+    assert clusterer.partial_fit(posts + posts) == 0
+
+
+def test_merge_redirects_members_when_ids_are_no_longer_kept():
+    clusterer = IdeaClusterer(batch_size=8, retire_size=0, maintenance_interval=1000)
+    clusterer.partial_fit(mixed_posts(8))
+    invoice = clusterer.cluster_of('invoice0')
+    hiring = clusterer.cluster_of('hiring0')
+    assert clusterer.clusters[invoice]['members'] is None
+
+    clusterer._merge(invoice, hiring)
+
+    assert invoice not in clusterer.clusters
+    assert clusterer.cluster_of('invoice3') == hiring
+    assert clusterer.clusters[hiring]['size'] == 16
+
+
+def test_small_stale_cluster_is_retired_and_unassigned():
+    clusterer = IdeaClusterer(batch_size=4, stale_batches=2, maintenance_interval=1)
+    clusterer.partial_fit([{'id': 'odd', 'title': "lonely lighthouse keeper scheduling",
+                            'created_utc': 1700000000}])
+    assert clusterer.cluster_of('odd') is not None
+
+    clusterer.partial_fit(make_posts('invoice', 12))
+
+    assert clusterer.cluster_of('odd') is None
+    assert len(clusterer.clusters) == 1
+
+
+def test_representatives_are_scored_against_current_centroid():
+    clusterer = IdeaClusterer(batch_size=1, num_representatives=2)
+    seed = {'id': 'seed', 'title': "invoice reconciliation quarterly spreadsheet nightmare",
+            'created_utc': 1700000000}
+    clusterer.partial_fit([seed] + make_posts('invoice', 12))
+
+    reps = clusterer.clusters[clusterer.cluster_of('seed')]['representatives']
+    similarities = [rep['similarity'] for rep in reps]
+
+    assert reps[0]['id'] != 'seed'
+    assert similarities == sorted(similarities, reverse=True)
+    assert all(similarity < 1.0 for similarity in similarities)
+
+
+def test_representative_posts_picks_one_post_per_theme():
+    clusterer = IdeaClusterer(batch_size=8)
+    posts = mixed_posts(16)
+    clusterer.partial_fit(posts)
+
+    chosen = clusterer.representative_posts(posts)
+
+    assert len(chosen) == len(THEMES)
+    assert {post['id'].rstrip('0123456789') for post in chosen} == set(THEMES)
+    assert all(post['cluster_size'] == 16 for post in chosen)
+
+
+def test_round_trip_preserves_assignments(tmp_path):
+    clusterer = IdeaClusterer(batch_size=8)
+    posts = mixed_posts(12)
+    clusterer.partial_fit(posts)
+    path = str(tmp_path / 'clusters.json')
+    clusterer.save(path)
+
+    loaded = IdeaClusterer.load(path)
+
+    assert [loaded.cluster_of(post['id']) for post in posts] == \
+        [clusterer.cluster_of(post['id']) for post in posts]
+    assert loaded.summary() == clusterer.summary()
+    new_posts = make_posts('invoice', 4, start=100)
+    loaded.partial_fit(new_posts)
+    assert {loaded.cluster_of(post['id']) for post in new_posts} == {loaded.cluster_of('invoice0')}
@@ -0,0 +1,111 @@
+"""Tests for resumable subreddit sweeps."""
+
+import importlib
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('praw')
+pytest.importorskip('dotenv')
+
+import prawcore  # noqa: E402
+
+
+def response(status_code):
+    return SimpleNamespace(status_code=status_code, headers={})
+
+
+class FakeSubreddit:
+    def __init__(self, name, errors):
+        self.name = name
+        self.errors = errors
+
+    def hot(self, limit):
+        if self.name in self.errors:
+            raise self.errors[self.name]
+        return [SimpleNamespace(id=f"{self.name}{i}", title="Manual invoice process is a pain",
+                                permalink=f"/r/{self.name}/{i}", score=i, num_comments=i,
+                                created_utc=1700000000, selftext='')
+                for i in range(limit)]
+
+
+class FakeReddit:
+    errors = {}
+
+    def __init__(self, **kwargs):
+        pass
+
+    def subreddit(self, name):
+        return FakeSubreddit(name, self.errors)
+
+
+@pytest.fixture
+def scanner(tmp_path, monkeypatch):
+    # The module writes logs/ on import, so import it inside the temporary directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('REDDIT_CLIENT_ID', 'id')
+    monkeypatch.setenv('REDDIT_CLIENT_SECRET', 'secret')
+    monkeypatch.setenv('REDDIT_USER_AGENT', 'tests')
+    module = importlib.import_module('reddit_scanner')
+    monkeypatch.setattr(module.praw, 'Reddit', FakeReddit)
+    monkeypatch.setattr(FakeReddit, 'errors', {})
+
+    scraper = module.RedditIdeaScraper()
+    scraper.target_subreddits = ['alpha', 'beta', 'gamma']
+    scraper.max_retries = 0
+    return module, scraper
+
+
+def test_scan_all_subreddits_collects_every_subreddit(scanner):
+    _, scraper = scanner
+    posts = scraper.scan_all_subreddits(posts_per_subreddit=3)
+
+    assert [post['id'] for post in posts] == [f"{name}{i}" for name in ('alpha', 'beta', 'gamma')
+                                              for i in range(3)]
+    assert all(post['is_idea_candidate'] and 'observed_at' in post for post in posts)
+
+
+def test_sweep_resumes_from_checkpoint(scanner, tmp_path):
+    module, scraper = scanner
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = module.SweepCheckpoint(path, posts_per_subreddit=2)
+    checkpoint.mark_complete('alpha', [{'id': 'saved', 'is_idea_candidate': False}])
+
+    posts = scraper.scan_all_subreddits(2, checkpoint=module.SweepCheckpoint(path, posts_per_subreddit=2))
+
+    assert posts[0]['id'] == 'saved'
+    assert len(posts) == 5
+
+
+def test_stale_or_mismatched_checkpoint_is_discarded(scanner, tmp_path):
+    module, _ = scanner
+    path = tmp_path / 'checkpoint.json'
+    state = {'started_at': (datetime.now() - timedelta(hours=7)).isoformat(),
+             'posts_per_subreddit': 2, 'results': {'alpha': []}}
+    path.write_text(json.dumps(state))
+
+    assert not module.SweepCheckpoint(str(path), posts_per_subreddit=2).is_complete('alpha')
+
+    state['started_at'] = datetime.now().isoformat()
+    path.write_text(json.dumps(state))
+    assert module.SweepCheckpoint(str(path), posts_per_subreddit=2).is_complete('alpha')
+    assert not module.SweepCheckpoint(str(path), posts_per_subreddit=5).is_complete('alpha')
+
+
+def test_breaker_trips_only_for_unavailable_subreddits(scanner, tmp_path):
+    module, scraper = scanner
+    FakeReddit.errors = {
+        'alpha': prawcore.exceptions.Forbidden(response(403)),
+        'beta': prawcore.exceptions.ResponseException(response(503)),
+        'gamma': RuntimeError("bug while parsing"),
+    }
+    breaker = module.CircuitBreaker(str(tmp_path / 'breaker.json'), failure_threshold=1)
+
+    assert scraper.scan_all_subreddits(2, breaker=breaker) == []
+
+    assert breaker.is_open('alpha')
+    assert not breaker.is_open('beta')
+    assert not breaker.is_open('gamma')
+    assert set(breaker.state) == {'alpha'}
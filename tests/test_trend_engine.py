@@ -0,0 +1,116 @@
+"""Tests for the incremental trend engine."""
+
+from trend_engine import SECONDS_PER_DAY, TrendEngine, extract_phrases
+
+DAY = 20000
+
+
+def make_post(post_id, day, title, subject='Business', indicators=()):
+    return {
+        'id': str(post_id),
+        'created_utc': day * SECONDS_PER_DAY + 60,
+        'subject': subject,
+        'title': title,
+        'pain_indicators': list(indicators)
+    }
+
+
+def end_of(day):
+    return day * SECONDS_PER_DAY + SECONDS_PER_DAY - 1
+
+
+def test_extract_phrases_skips_stopwords_and_builds_bigrams():
+    phrases = extract_phrases("I hate doing invoice reconciliation by hand")
+    assert {'hate', 'invoice', 'reconciliation', 'invoice reconciliation', 'hand'} <= phrases
+    assert 'doing' not in phrases
+    assert not any('by' in phrase.split() for phrase in phrases)
+
+
+def test_count_sums_days_in_window():
+    engine = TrendEngine(width=1024)
+    engine.ingest_many(make_post(i, DAY - i % 3, "invoice pain") for i in range(9))
+
+    assert engine.count('Business', 'invoice', days=1, now=end_of(DAY)) == 3
+    assert engine.count('Business', 'invoice', days=3, now=end_of(DAY)) == 9
+    assert engine.count('Other', 'invoice', days=3, now=end_of(DAY)) == 0
+
+
+def test_repeated_post_is_ingested_once():
+    engine = TrendEngine(width=1024)
+    post = make_post(1, DAY, "invoice pain")
+
+    assert engine.ingest(post)
+    assert not engine.ingest(post)
+    assert engine.count('Business', 'invoice', days=1, now=end_of(DAY)) == 1
+
+
+def test_ring_recycles_old_days_and_rejects_expired_posts():
+    engine = TrendEngine(num_days=7, width=1024)
+    engine.ingest(make_post(1, DAY, "invoice pain"))
+    engine.ingest(make_post(2, DAY + 7, "invoice pain"))
+
+    assert engine.count('Business', 'invoice', days=7, now=end_of(DAY + 7)) == 1
+    assert not engine.ingest(make_post(3, DAY, "invoice pain"))
+
+
+def test_eviction_keeps_frequent_key_over_recent_singletons():
+    engine = TrendEngine(width=4096, max_tracked=200)
+    post_id = 0
+    for day in range(DAY - 6, DAY - 1):
+        for _ in range(20):
+            post_id += 1
+            engine.ingest(make_post(post_id, day, "invoice reconciliation"))
+    for day in (DAY - 1, DAY):
+        for _ in range(300):
+            post_id += 1
+            engine.ingest(make_post(post_id, day, f"w{post_id}"))
+
+    assert len(engine.tracked) <= 200
+    assert 'Business|invoice reconciliation' in engine.tracked
+
+
+def test_top_rising_has_no_score_without_baseline_history():
+    engine = TrendEngine(width=1024)
+    engine.ingest_many(make_post(i, DAY, "app tool") for i in range(50))
+
+    rising = engine.top_rising(days=7, now=end_of(DAY))
+
+    assert rising
+    assert all(r['z_score'] is None and not r['is_spike'] for r in rising)
+    assert engine.spikes(days=7, now=end_of(DAY)) == []
+
+
+def test_top_rising_flags_spike_against_baseline():
+    engine = TrendEngine(width=4096)
+    post_id = 0
+    for day in range(DAY - 27, DAY + 1):
+        for i in range(10):
+            post_id += 1
+            engine.ingest(make_post(post_id, day, f"steady topic{i % 5}"))
+    for _ in range(30):
+        post_id += 1
+        engine.ingest(make_post(post_id, DAY, "invoice reconciliation"))
+
+    spikes = engine.spikes(days=7, now=end_of(DAY))
+    phrases = {spike['phrase'] for spike in spikes}
+
+    assert 'invoice reconciliation' in phrases
+    assert 'steady' not in phrases
+
+
+def test_round_trip_preserves_state(tmp_path):
+    engine = TrendEngine(num_days=14, width=512, depth=3)
+    engine.ingest_many(make_post(i, DAY - i % 4, "invoice pain") for i in range(12))
+    path = str(tmp_path / 'trends.json')
+    engine.save(path)
+
+    loaded = TrendEngine.load(path)
+
+    assert loaded.count('Business', 'invoice', days=14, now=end_of(DAY)) == 12
+    assert loaded.tracked == engine.tracked
+    assert not loaded.ingest(make_post(0, DAY, "invoice pain"))
+
+
+def test_load_missing_file_starts_empty(tmp_path):
+    engine = TrendEngine.load(str(tmp_path / 'missing.json'))
+    assert engine.tracked == {}
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Trend Engine for Reddit Ideas Scrapper
+
+Maintains compact rolling counters of pain point mentions per subject and
+phrase as posts are ingested, and reports statistically significant spikes
+without rescanning raw scan history.
+
+Author: Anthony Stepvoy
+License: MIT
+"""
+
+import os
+import re
+import argparse
+import json
+import math
+import zlib
+import base64
+import hashlib
+import heapq
+import logging
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRENDS_FILE = os.path.join('data', 'trends.json')
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Tracked keys' mention counts halve after this many days without a mention
+TRACKED_HALF_LIFE_DAYS = 7
+
+# Words that carry no meaning on their own when building phrases
+STOPWORDS = {
+    'a', 'about', 'after', 'all', 'also', 'am', 'an', 'and', 'any', 'are', 'as', 'at',
+    'be', 'been', 'but', 'by', 'can', 'could', 'did', 'do', 'does', 'doing', 'for',
+    'from', 'get', 'got', 'had', 'has', 'have', 'how', 'i', 'if', 'im', 'in', 'into',
+    'is', 'it', 'its', 'just', 'me', 'my', 'no', 'not', 'of', 'on', 'or', 'our', 'out',
+    'over', 'really', 'should', 'so', 'some', 'than', 'that', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'to', 'up', 'us', 'was', 'we', 'what',
+    'when', 'where', 'which', 'who', 'why', 'will', 'with', 'would', 'you', 'your'
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-']*")
+
+
+def extract_phrases(text: str) -> Set[str]:
+    """
+    Extract keyword unigrams and adjacent-word bigrams from text.
+
+    Args:
+        text: Text to tokenize (typically a post title)
+
+    Returns:
+        Set of phrases such as "invoice" and "invoice reconciliation"
+    """
+    tokens = [token.replace("'", '').strip('-') for token in TOKEN_PATTERN.findall(text.lower())]
+    phrases = set()
+
+    for i, token in enumerate(tokens):
+        if len(token) < 3 or token in STOPWORDS:
+            continue
+        phrases.add(token)
+        if i + 1 < len(tokens):
+            following = tokens[i + 1]
+            if len(following) >= 3 and following not in STOPWORDS:
+                phrases.add(f"{token} {following}")
+
+    return phrases
+
+
+class TrendEngine:
+    """
+    Rolling per-day counters of pain point phrases keyed by subject.
+
+    Phrase counts live in a count-min sketch with one slice per day in a ring
+    of ``num_days`` buckets, so memory is fixed no matter how many posts are
+    ingested. Exact per-subject post totals normalise for scan volume, and a
+    bounded set of tracked keys is what queries enumerate. Each tracked key
+    carries its last-seen day and a mention count that decays with a
+    ``TRACKED_HALF_LIFE_DAYS`` half-life, so eviction never touches the sketch
+    and drops keys that have left the ring, then the least mentioned: a phrase
+    mentioned often last week outlives one mentioned once today. Evicting a
+    tracked key loses nothing: its counts stay in the sketch and it is picked
+    up again the next time it is mentioned.
+    """
+
+    def __init__(self, num_days: int = 56, width: int = 8192, depth: int = 4,
+                 max_tracked: int = 5000, max_seen_ids: int = 100000):
+        """
+        Initialize empty counters.
+
+        Args:
+            num_days: Days of history kept in the ring of buckets
+            width: Counters per sketch row; larger means fewer collisions
+            depth: Number of sketch rows (independent hashes)
+            max_tracked: Maximum number of subject/phrase keys kept for queries
+            max_seen_ids: Number of recent post IDs remembered to skip re-ingestion
+        """
+        self.num_days = num_days
+        self.width = width
+        self.depth = depth
+        self.max_tracked = max_tracked
+        self.max_seen_ids = max_seen_ids
+
+        self.day_stamps = array('l', [-1]) * num_days
+        self.counts = array('I', [0]) * (num_days * depth * width)
+        self.subject_counts: Dict[str, array] = {}
+        # key -> [last seen day, decayed mentions as of that day]
+        self.tracked: Dict[str, List[float]] = {}
+        self.seen_ids: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def make_key(subject: str, phrase: str) -> str:
+        """Build the counter key for a subject and phrase."""
+        return f"{subject}|{phrase}"
+
+    def _columns(self, key: str) -> List[int]:
+        """Return the sketch column for the key in each row."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def _slot(self, day: int) -> Optional[int]:
+        """
+        Return the ring slot for a day, recycling the slot if it holds an older day.
+
+        Returns:
+            Slot index, or None if the day has already rolled out of the ring
+        """
+        slot = day % self.num_days
+        stamp = self.day_stamps[slot]
+
+        if stamp == day:
+            return slot
+        if stamp > day:
+            return None
+
+        span = self.depth * self.width
+        self.counts[slot * span:(slot + 1) * span] = array('I', [0]) * span
+        for totals in self.subject_counts.values():
+            totals[slot] = 0
+        self.day_stamps[slot] = day
+        return slot
+
+    def _add(self, slot: int, columns: List[int]) -> None:
+        """Increment a key's counters using conservative update to limit overestimation."""
+        base = slot * self.depth * self.width
+        indexes = [base + row * self.width + col for row, col in enumerate(columns)]
+        current = min(self.counts[i] for i in indexes)
+        for i in indexes:
+            if self.counts[i] == current:
+                self.counts[i] = current + 1
+
+    def _estimate(self, columns: List[int], days: Iterable[int]) -> int:
+        """Estimate a key's total count over the given days."""
+        total = 0
+        for day in days:
+            slot = day % self.num_days
+            if self.day_stamps[slot] != day:
+                continue
+            base = slot * self.depth * self.width
+            total += min(self.counts[base + row * self.width + col] for row, col in enumerate(columns))
+        return total
+
+    def _subject_total(self, subject: str, days: Iterable[int]) -> int:
+        """Return the exact number of posts ingested for a subject over the given days."""
+        totals = self.subject_counts.get(subject)
+        if totals is None:
+            return 0
+        return sum(totals[day % self.num_days] for day in days
+                   if self.day_stamps[day % self.num_days] == day)
+
+    @staticmethod
+    def _decay(days: float) -> float:
+        """Return the factor a tracked mention count decays by over a number of days."""
+        return 0.5 ** (days / TRACKED_HALF_LIFE_DAYS)
+
+    def _history_days(self, subject: str, days: Iterable[int]) -> int:
+        """Return how many of the given days have at least one post ingested for a subject."""
+        totals = self.subject_counts.get(subject)
+        if totals is None:
+            return 0
+        return sum(1 for day in days
+                   if self.day_stamps[day % self.num_days] == day and totals[day % self.num_days])
+
+    def _track(self, key: str, day: int) -> None:
+        """Remember a key for queries, evicting the weakest keys when over capacity."""
+        entry = self.tracked.get(key)
+        if entry is None:
+            self.tracked[key] = [day, 1.0]
+        elif day >= entry[0]:
+            entry[1] = entry[1] * self._decay(day - entry[0]) + 1
+            entry[0] = day
+        else:
+            # Backfilled mention older than the last one
+            entry[1] += self._decay(entry[0] - day)
+        if len(self.tracked) <= self.max_tracked:
+            return
+
+        # Evict in batches so the cost is amortised over many mentions
+        latest_day = max(self.day_stamps)
+        oldest_day = latest_day - self.num_days + 1
+
+        def strength(item):
+            last_day, mentions = item[1]
+            if last_day < oldest_day:
+                return -1.0
+            return mentions * self._decay(latest_day - last_day)
+
+        evict_count = max(1, self.max_tracked // 4)
+        for weak_key, _ in heapq.nsmallest(evict_count, self.tracked.items(), key=strength):
+            del self.tracked[weak_key]
+
+    def ingest(self, post: Dict) -> bool:
+        """
+        Update the counters with a single scanned post.
+
+        Args:
+            post: Post dictionary as produced by RedditIdeaScraper
+
+        Returns:
+            True if the post was counted, False if it was a repeat or too old
+        """
+        post_id = post.get('id')
+        if post_id in self.seen_ids:
+            return False
+
+        day = int(post['created_utc'] // SECONDS_PER_DAY)
+        slot = self._slot(day)
+        if slot is None:
+            return False
+
+        self.seen_ids[post_id] = None
+        if len(self.seen_ids) > self.max_seen_ids:
+            self.seen_ids.popitem(last=False)
+
+        subject = post.get('subject', 'Other')
+        totals = self.subject_counts.setdefault(subject, array('I', [0]) * self.num_days)
+        totals[slot] += 1
+
+        phrases = set(post.get('pain_indicators', [])) | extract_phrases(post.get('title', ''))
+        for phrase in phrases:
+            key = self.make_key(subject, phrase)
+            self._add(slot, self._columns(key))
+            self._track(key, day)
+
+        return True
+
+    def ingest_many(self, posts: Iterable[Dict]) -> int:
+        """
+        Update the counters with many posts.
+
+        Args:
+            posts: Post dictionaries as produced by RedditIdeaScraper
+
+        Returns:
+            Number of posts counted
+        """
+        ingested = sum(1 for post in posts if self.ingest(post))
+        logger.info(f"Trend engine ingested {ingested} posts")
+        return ingested
+
+    def count(self, subject: str, phrase: str, days: int = 7, now: Optional[float] = None) -> int:
+        """
+        Estimate how many posts mentioned a phrase in a subject over the last N days.
+
+        Args:
+            subject: Subject category
+            phrase: Phrase or pain indicator
+            days: Window length in days
+            now: Optional Unix timestamp marking the end of the window
+
+        Returns:
+            Estimated post count (never an underestimate)
+        """
+        end_day = int((now if now is not None else datetime.now().timestamp()) // SECONDS_PER_DAY)
+        window = range(end_day - days + 1, end_day + 1)
+        return self._estimate(self._columns(self.make_key(subject, phrase)), window)
+
+    def top_rising(self, days: int = 7, top: int = 10, min_count: int = 3,
+                   z_threshold: float = 3.0, subject: Optional[str] = None,
+                   now: Optional[float] = None) -> List[Dict]:
+        """
+        Rank phrases by how far their recent count exceeds their baseline.
+
+        The baseline is every older day still in the ring, scaled by the ratio
+        of the subject's recent to baseline post volume so that scanning more
+        posts does not look like a trend. Spikes are scored with a Poisson
+        z-score and flagged as significant above ``z_threshold``. Until the
+        subject has posts on at least as many baseline days as the recent
+        window spans, there is nothing to compare against: such phrases are
+        reported with no z-score, are never flagged, and rank after scored
+        phrases by recent count.
+
+        Args:
+            days: Length of the recent window in days
+            top: Maximum number of results
+            min_count: Minimum recent mentions for a phrase to be reported
+            z_threshold: z-score above which a rise is flagged as significant
+            subject: Optional subject category to restrict results to
+            now: Optional Unix timestamp marking the end of the recent window
+
+        Returns:
+            List of dictionaries describing rising phrases, strongest first
+        """
+        end_day = int((now if now is not None else datetime.now().timestamp()) // SECONDS_PER_DAY)
+        recent_days = range(end_day - days + 1, end_day + 1)
+        baseline_days = range(end_day - self.num_days + 1, end_day - days + 1)
+
+        results = []
+        # subject -> whether it has enough baseline days to score against
+        history: Dict[str, bool] = {}
+        for key in self.tracked:
+            key_subject, phrase = key.split('|', 1)
+            if subject and key_subject != subject:
+                continue
+
+            columns = self._columns(key)
+            recent = self._estimate(columns, recent_days)
+            if recent < min_count:
+                continue
+            baseline = self._estimate(columns, baseline_days)
+
+            if key_subject not in history:
+                history[key_subject] = self._history_days(key_subject, baseline_days) >= days
+            if not history[key_subject]:
+                results.append({
+                    'subject': key_subject,
+                    'phrase': phrase,
+                    'recent_count': recent,
+                    'baseline_count': baseline,
+                    'expected_count': None,
+                    'growth_ratio': None,
+                    'z_score': None,
+                    'is_spike': False
+                })
+                continue
+
+            recent_volume = self._subject_total(key_subject, recent_days)
+            baseline_volume = self._subject_total(key_subject, baseline_days)
+            expected = baseline * recent_volume / baseline_volume
+
+            # Floor the expectation so phrases never seen before are not infinitely significant
+            expected = max(expected, 1.0)
+            z_score = (recent - expected) / math.sqrt(expected)
+
+            results.append({
+                'subject': key_subject,
+                'phrase': phrase,
+                'recent_count': recent,
+                'baseline_count': baseline,
+                'expected_count': round(expected, 2),
+                'growth_ratio': round(recent / expected, 2),
+                'z_score': round(z_score, 2),
+                'is_spike': z_score >= z_threshold
+            })
+
+        return heapq.nlargest(top, results, key=lambda r: (r['z_score'] is not None,
+                                                           r['z_score'] or 0, r['recent_count']))
+
+    def spikes(self, days: int = 7, min_count: int = 3, z_threshold: float = 3.0,
+               now: Optional[float] = None) -> List[Dict]:
+        """
+        Return only the statistically significant rises in the last N days.
+
+        Args:
+            days: Length of the recent window in days
+            min_count: Minimum recent mentions for a phrase to be reported
+            z_threshold: z-score above which a rise is flagged as significant
+            now: Optional Unix timestamp marking the end of the recent window
+
+        Returns:
+            List of significant rises, strongest first
+        """
+        rising = self.top_rising(days=days, top=len(self.tracked), min_count=min_count,
+                                 z_threshold=z_threshold, now=now)
+        return [r for r in rising if r['is_spike']]
+
+    def to_dict(self) -> Dict:
+        """Serialize the engine state to a JSON-compatible dictionary."""
+        return {
+            'num_days': self.num_days,
+            'width': self.width,
+            'depth': self.depth,
+            'max_tracked': self.max_tracked,
+            'max_seen_ids': self.max_seen_ids,
+            'day_stamps': list(self.day_stamps),
+            'counts': base64.b64encode(zlib.compress(self.counts.tobytes())).decode('ascii'),
+            'subject_counts': {subject: list(totals) for subject, totals in self.subject_counts.items()},
+            'tracked': self.tracked,
+            'seen_ids': list(self.seen_ids)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TrendEngine':
+        """Rebuild an engine from a dictionary produced by to_dict."""
+        engine = cls(num_days=data['num_days'], width=data['width'], depth=data['depth'],
+                     max_tracked=data['max_tracked'], max_seen_ids=data['max_seen_ids'])
+        engine.day_stamps = array('l', data['day_stamps'])
+        engine.counts = array('I')
+        engine.counts.frombytes(zlib.decompress(base64.b64decode(data['counts'])))
+        engine.subject_counts = {subject: array('I', totals)
+                                 for subject, totals in data['subject_counts'].items()}
+        engine.tracked = {key: list(entry) for key, entry in data['tracked'].items()}
+        engine.seen_ids = OrderedDict.fromkeys(data['seen_ids'])
+        return engine
+
+    def save(self, path: str = DEFAULT_TRENDS_FILE) -> None:
+        """
+        Save the engine state to disk.
+
+        Args:
+            path: Location of the trends file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+        logger.info(f"Trend state saved to {path}")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_TRENDS_FILE) -> 'TrendEngine':
+        """
+        Load the engine state from disk, starting empty if there is none.
+
+        Args:
+            path: Location of the trends file
+
+        Returns:
+            TrendEngine instance
+        """
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, zlib.error) as e:
+            logger.error(f"Failed to load trend state from {path}: {e}")
+            return cls()
+
+
+def print_rising(rising: List[Dict]) -> None:
+    """Print a table of rising pain points."""
+    if not rising:
+        print("📉 No rising pain points yet")
+        return
+
+    for i, trend in enumerate(rising, 1):
+        marker = "🔥" if trend['is_spike'] else "  "
+        if trend['z_score'] is None:
+            detail = "no baseline yet"
+        else:
+            detail = f"x{trend['growth_ratio']}, z={trend['z_score']}"
+        print(f"{marker} {i}. [{trend['subject']}] {trend['phrase']}: "
+              f"{trend['recent_count']} mentions ({detail})")
+
+
+def main():
+    """Print the top rising pain points from the saved trend state."""
+    parser = argparse.ArgumentParser(description="Show rising pain points from saved scans.")
+    parser.add_argument('--days', type=int, default=7, help="Length of the recent window in days")
+    parser.add_argument('--top', type=int, default=20, help="Number of phrases to show")
+    parser.add_argument('--subject', help="Only show phrases from this subject category")
+    args = parser.parse_args()
+
+    engine = TrendEngine.load()
+    print(f"📈 Top rising pain points in the last {args.days} days:")
+    print("-" * 50)
+    print_rising(engine.top_rising(days=args.days, top=args.top, subject=args.subject))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())